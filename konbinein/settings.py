@@ -37,6 +37,7 @@ INSTALLED_APPS = (
     # "django.contrib.sessions",
     # "django.contrib.messages",
     # "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "main",
     "drf_spectacular",
 )
@@ -86,6 +87,11 @@ DATABASES = {
 }
 
 
+PASSWORD_HASHING = {
+    "max_pending": 32,
+    "max_workers": 2,
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -162,6 +168,7 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": (
         "rest_framework.filters.OrderingFilter",
         "main.filter_backends.filter_backend.FilterBackend",
+        "main.filter_backends.search_filter_backend.SearchFilterBackend",
     ),
     "DEFAULT_PAGINATION_CLASS": "main.paginations.pagination.Pagination",
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
@@ -180,6 +187,39 @@ CACHES = {
 }
 
 
+ACTIVITY_SINK = {
+    "BACKEND": "main.activity_sinks.buffered_activity_sink.BufferedActivitySink",
+    "OPTIONS": {
+        "buffer_capacity": 10000,
+        "flush_interval": 1,
+        "max_buffer_size": 100,
+    },
+}
+
+ACTIVITY_ARCHIVE_DIRECTORY = BASE_DIR / "archives" / "activities"
+
+ACTIVITY_SNAPSHOT_INTERVAL = 50
+
+ACTIVITY_STATE_TIMEOUT = 86400
+
+LAZY_LOAD_ASSERTION = DEBUG
+
+ORDER_BATCH_MAX_SIZE = 100
+
+ORDER_IMPORT = {
+    "chunk_size": 500,
+    # The web process writes uploads here and the Celery worker reads them, so
+    # both must share this filesystem. Run delete_order_import_files daily.
+    "directory": BASE_DIR / "imports" / "orders",
+    "max_errors": 1000,
+    "timeout": 7 * 24 * 60 * 60,
+}
+
+PAGINATION_COUNT_TIMEOUT = 10
+
+PRICING_TABLES_MAX_SIZE = 128
+
+
 MONGO = {
     "authentication_source": "admin",
     "db": "mongo",
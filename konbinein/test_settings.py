@@ -1,4 +1,15 @@
 from konbinein import settings
 from konbinein.settings import *  # noqa: F401, F403
+from main.tests.call_recorder import mongo_command_listener
 
-MONGO = {**settings.MONGO, "db": "test"}
+LAZY_LOAD_ASSERTION = True
+
+MONGO = {
+    **settings.MONGO,
+    "db": "test",
+    "event_listeners": [mongo_command_listener],
+}
+
+ACTIVITY_SINK = {
+    "BACKEND": "main.activity_sinks.synchronous_activity_sink.SynchronousActivitySink",
+}
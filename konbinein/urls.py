@@ -2,10 +2,13 @@ from django.urls import path
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView
 from rest_framework import routers
 
+from main.view_sets.admin_metric_view_set import AdminMetricViewSet
 from main.view_sets.admin_organization_view_set import AdminOrganizationViewSet
 from main.view_sets.admin_user_view_set import AdminUserViewSet
+from main.view_sets.order_import_view_set import OrderImportViewSet
 from main.view_sets.order_shipping_view_set import OrderShippingViewSet
 from main.view_sets.order_view_set import OrderViewSet
+from main.view_sets.organization_activity_view_set import OrganizationActivityViewSet
 from main.view_sets.organization_organization_view_set import (
     OrganizationOrganizationViewSet,
 )
@@ -14,17 +17,29 @@ from main.view_sets.organization_user_view_set import OrganizationUserViewSet
 from main.view_sets.product_shipping_view_set import ProductShippingViewSet
 from main.view_sets.product_view_set import ProductViewSet
 from main.view_sets.public_user_view_set import PublicUserViewSet
+from main.view_sets.public_zone_view_set import PublicZoneViewSet
 from main.view_sets.user_organization_view_set import UserOrganizationViewSet
 from main.view_sets.user_staff_view_set import UserStaffViewSet
 from main.view_sets.user_user_view_set import UserUserViewSet
 
 router = routers.SimpleRouter(trailing_slash=False)
 # Admin
+router.register("admin/metrics", AdminMetricViewSet, basename="admin-metric")
 router.register(
     "admin/organizations", AdminOrganizationViewSet, basename="admin-organization"
 )
 router.register("admin/users", AdminUserViewSet, basename="admin-user")
 # Organization
+router.register(
+    "organizations/(?P<organization_id>[^/.]+)/activities",
+    OrganizationActivityViewSet,
+    basename="organization-activity",
+)
+router.register(
+    "organizations/(?P<organization_id>[^/.]+)/order-imports",
+    OrderImportViewSet,
+    basename="order-import",
+)
 router.register(
     "organizations/(?P<organization_id>[^/.]+)/order-shippings", OrderShippingViewSet
 )
@@ -51,6 +66,7 @@ router.register(
 )
 # Public
 router.register("public/users", PublicUserViewSet, basename="public-user")
+router.register("public/zones", PublicZoneViewSet, basename="public-zone")
 # User
 router.register(
     "users/(?P<user_id>[^/.]+)/organizations",
@@ -0,0 +1,44 @@
+from functools import cache
+
+from bson import ObjectId
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from main.shortcuts import OBSCURE_ACTIVITY_DATA_KEYS, set_activity_states
+
+
+@cache
+def get_activity_sink():
+    return import_string(settings.ACTIVITY_SINK["BACKEND"])(
+        **settings.ACTIVITY_SINK.get("OPTIONS", {})
+    )
+
+
+def write_creation_activities(
+    activity_class,
+    activity_type,
+    creator_id,
+    creator_organization_id,
+    instances_and_data,
+):
+    attributes_list = []
+    states = {}
+    for instance, request_data in instances_and_data:
+        data = {
+            key: value
+            for key, value in request_data.items()
+            if key not in OBSCURE_ACTIVITY_DATA_KEYS
+        }
+        attributes_list.append({
+            "creator_id": creator_id,
+            "creator_organization_id": creator_organization_id,
+            "creator_type": activity_type,
+            "data": data,
+            "id": ObjectId(),
+            "object_id": instance.id,
+            "organization_id": getattr(instance, "organization_id", None),
+            "user_id": getattr(instance, "user_id", None),
+        })
+        states[instance.id] = {"data": data, "diff_count": 1}
+    get_activity_sink().write_many(activity_class, attributes_list)
+    set_activity_states(activity_class, states)
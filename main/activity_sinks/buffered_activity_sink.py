@@ -0,0 +1,96 @@
+from atexit import register
+from collections import defaultdict
+from logging import getLogger
+from threading import Event, Lock, Thread
+
+logger = getLogger(__name__)
+
+
+class BufferedActivitySink:
+    def __init__(self, buffer_capacity=10000, flush_interval=1, max_buffer_size=100):
+        self.buffer_capacity = buffer_capacity
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self._buffered_count = 0
+        self._buffers = defaultdict(list)
+        self._flush_event = Event()
+        self._flush_lock = Lock()
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._thread = None
+
+    def flush(self, activity_class=None):
+        # Flushes run one at a time, so a flush returns only after the
+        # activities another flush has already taken are written too.
+        with self._flush_lock:
+            with self._lock:
+                if activity_class is None:
+                    buffers = self._buffers
+                    self._buffers = defaultdict(list)
+                else:
+                    buffers = {activity_class: self._buffers.pop(activity_class, [])}
+                self._buffered_count -= sum(map(len, buffers.values()))
+            for buffered_class, activities in buffers.items():
+                if not activities:
+                    continue
+                try:
+                    buffered_class.insert_partitioned(activities)
+                except Exception:
+                    logger.exception(
+                        "Failed to write %d %s documents.",
+                        len(activities),
+                        buffered_class.__name__,
+                    )
+                    self._requeue(buffered_class, activities)
+
+    def stop(self):
+        self._stop_event.set()
+        self._flush_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def write(self, activity_class, attributes):
+        self.write_many(activity_class, (attributes,))
+
+    def write_many(self, activity_class, attributes_list):
+        activities = [activity_class(**attributes) for attributes in attributes_list]
+        for activity in activities:
+            activity.validate()
+        with self._lock:
+            if self._thread is None:
+                self._start()
+            is_full = self._buffered_count + len(activities) > self.buffer_capacity
+            if not is_full:
+                buffer = self._buffers[activity_class]
+                buffer.extend(activities)
+                self._buffered_count += len(activities)
+                if len(buffer) >= self.max_buffer_size:
+                    self._flush_event.set()
+        if is_full:
+            activity_class.insert_partitioned(activities)
+
+    def _requeue(self, activity_class, activities):
+        with self._lock:
+            requeued_count = max(
+                min(len(activities), self.buffer_capacity - self._buffered_count), 0
+            )
+            self._buffers[activity_class][:0] = activities[:requeued_count]
+            self._buffered_count += requeued_count
+        if requeued_count < len(activities):
+            logger.error(
+                "Dropped %d %s documents because the buffer is full.",
+                len(activities) - requeued_count,
+                activity_class.__name__,
+            )
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
+
+    def _start(self):
+        self._thread = Thread(daemon=True, name="activity-sink", target=self._run)
+        self._thread.start()
+        register(self.stop)
@@ -0,0 +1,11 @@
+class SynchronousActivitySink:
+    def flush(self, activity_class=None):
+        pass
+
+    def write(self, activity_class, attributes):
+        self.write_many(activity_class, (attributes,))
+
+    def write_many(self, activity_class, attributes_list):
+        activity_class.insert_partitioned([
+            activity_class(**attributes) for attributes in attributes_list
+        ])
@@ -1,8 +1,9 @@
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
+from main.metrics import increment_counter
 from main.models.user import User
-from main.shortcuts import get_authentication_token
+from main.shortcuts import get_authentication_token_and_user, set_authentication_user
 
 
 class BearerAuthentication(BaseAuthentication):
@@ -18,9 +19,18 @@ class BearerAuthentication(BaseAuthentication):
         try:
             user_id = header[1]
             token = header[2]
-            if get_authentication_token(user_id) != token:
-                raise AuthenticationFailed()
-            user = User.objects.get(id=user_id)
         except IndexError:
             raise AuthenticationFailed()
+        cached_token, cached_user = get_authentication_token_and_user(user_id)
+        if cached_token != token:
+            raise AuthenticationFailed()
+        if cached_user is not None:
+            increment_counter("authentication_user_cache.hit")
+            return User(**cached_user), None
+        increment_counter("authentication_user_cache.miss")
+        try:
+            user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            raise AuthenticationFailed()
+        set_authentication_user(user)
         return user, None
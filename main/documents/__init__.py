@@ -0,0 +1,17 @@
+from main.documents.order_activity import OrderActivity
+from main.documents.order_shipping_activity import OrderShippingActivity
+from main.documents.organization_activity import OrganizationActivity
+from main.documents.product_activity import ProductActivity
+from main.documents.product_shipping_activity import ProductShippingActivity
+from main.documents.staff_activity import StaffActivity
+from main.documents.user_activity import UserActivity
+
+ACTIVITY_CLASSES = (
+    OrderActivity,
+    OrderShippingActivity,
+    OrganizationActivity,
+    ProductActivity,
+    ProductShippingActivity,
+    StaffActivity,
+    UserActivity,
+)
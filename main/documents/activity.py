@@ -1,7 +1,18 @@
+from collections import defaultdict
+from re import escape, fullmatch
+
+from bson import ObjectId
 from mongoengine import DictField, IntField, StringField
+from pymongo.errors import BulkWriteError
 
+from main.documents.activity_snapshot import ActivitySnapshot
+from main.documents.partitioned_query_set import PartitionedQuerySet
 from main.shortcuts import ActivityType
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+_indexed_partition_names = set()
+
 
 class Activity:
     creator_id = IntField()
@@ -9,3 +20,106 @@ class Activity:
     creator_type = StringField(choices=ActivityType.ALL, required=True)
     data = DictField()
     object_id = IntField(required=True)
+
+    @classmethod
+    def drop_partition(cls, partition_name):
+        cls._get_db().drop_collection(partition_name)
+        _indexed_partition_names.discard(partition_name)
+
+    @classmethod
+    def ensure_collection_indexes(cls, collection):
+        for spec in cls._meta["index_specs"]:
+            options = {**spec}
+            fields = options.pop("fields")
+            collection.create_index(fields, background=True, **options)
+
+    @classmethod
+    def get_partition_collection(cls, partition_name):
+        collection = cls._get_db()[partition_name]
+        if partition_name not in _indexed_partition_names:
+            cls.ensure_collection_indexes(collection)
+            _indexed_partition_names.add(partition_name)
+        return collection
+
+    @classmethod
+    def get_partition_name(cls, object_id):
+        return f"{cls._get_collection_name()}_{object_id.generation_time:%Y_%m}"
+
+    @classmethod
+    def get_partition_names(cls):
+        return sorted(
+            name
+            for name in cls._get_db().list_collection_names()
+            if cls.is_partition_name(name)
+        )
+
+    @classmethod
+    def get_diff_state(cls, object_id):
+        state, diff_count = cls._get_state(object_id)
+        return {"data": state or {}, "diff_count": diff_count}
+
+    @classmethod
+    def get_state(cls, object_id, before=None):
+        return cls._get_state(object_id, before)[0]
+
+    @classmethod
+    def insert_partitioned(cls, activities):
+        partitions = defaultdict(list)
+        for activity in activities:
+            if activity.id is None:
+                activity.id = ObjectId()
+            activity.validate()
+            partitions[cls.get_partition_name(activity.id)].append(activity.to_mongo())
+        for partition_name, documents in partitions.items():
+            try:
+                cls.get_partition_collection(partition_name).insert_many(
+                    documents, ordered=False
+                )
+            except BulkWriteError as error:
+                # A retried batch may have been partially written already.
+                if error.details.get("writeConcernErrors") or any(
+                    write_error["code"] != DUPLICATE_KEY_ERROR_CODE
+                    for write_error in error.details["writeErrors"]
+                ):
+                    raise
+
+    @classmethod
+    def is_partition_name(cls, name):
+        return (
+            fullmatch(rf"{escape(cls._get_collection_name())}_\d{{4}}_\d{{2}}", name)
+            is not None
+        )
+
+    @classmethod
+    def partitioned_objects(cls, **filter_):
+        return PartitionedQuerySet(cls, (filter_,))
+
+    @classmethod
+    def save_snapshot(cls, activity_id, object_id, data):
+        ActivitySnapshot(
+            activity_id=activity_id,
+            collection=cls._get_collection_name(),
+            data=data,
+            object_id=object_id,
+        ).save()
+
+    @classmethod
+    def _get_state(cls, object_id, before=None):
+        snapshots = ActivitySnapshot.objects(
+            collection=cls._get_collection_name(), object_id=object_id
+        )
+        activities = cls.partitioned_objects(object_id=object_id).order_by("id")
+        if before is not None:
+            snapshots = snapshots.filter(activity_id__lt=before)
+            activities = activities.filter(id__lt=before)
+        snapshot = snapshots.order_by("-activity_id").first()
+        if snapshot is None:
+            state = None
+        else:
+            state = {**snapshot.data}
+            activities = activities.filter(id__gt=snapshot.activity_id)
+        diff_count = 0
+        for activity in activities:
+            state = {**(state or {}), **activity.data}
+            diff_count += 1
+        return state, diff_count
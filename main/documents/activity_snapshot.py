@@ -0,0 +1,21 @@
+from mongoengine import DictField, Document, IntField, ObjectIdField, StringField
+
+
+class ActivitySnapshot(Document):
+    meta = {
+        "auto_create_index": False,
+        "index_background": True,
+        "indexes": [("collection", "object_id", "-activity_id")],
+    }
+
+    activity_id = ObjectIdField(required=True)
+    collection = StringField(required=True)
+    data = DictField()
+    object_id = IntField(required=True)
+
+    @classmethod
+    def ensure_collection_indexes(cls, collection):
+        for spec in cls._meta["index_specs"]:
+            options = {**spec}
+            fields = options.pop("fields")
+            collection.create_index(fields, background=True, **options)
@@ -4,4 +4,15 @@ from main.documents.activity import Activity
 
 
 class OrderShippingActivity(Activity, DynamicDocument):
+    meta = {
+        "auto_create_index": False,
+        "index_background": True,
+        "indexes": [
+            ("object_id", "-id"),
+            ("organization_id", "-id"),
+            ("organization_id", "creator_id", "-id"),
+            ("organization_id", "creator_type", "-id"),
+        ],
+    }
+
     organization_id = IntField(required=True)
@@ -4,4 +4,8 @@ from main.documents.activity import Activity
 
 
 class OrganizationActivity(Activity, DynamicDocument):
-    pass
+    meta = {
+        "auto_create_index": False,
+        "index_background": True,
+        "indexes": [("object_id", "-id")],
+    }
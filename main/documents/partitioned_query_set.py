@@ -0,0 +1,83 @@
+from mongoengine.queryset import QuerySet
+
+ID_BOUND_KEYS = {
+    "id__gt": "lower",
+    "id__gte": "lower",
+    "id__lt": "upper",
+    "id__lte": "upper",
+}
+
+
+class PartitionedQuerySet:
+    def __init__(self, activity_class, filters, ordering="-id", limit=None):
+        self.activity_class = activity_class
+        self.filters = filters
+        self.ordering = ordering
+        self._limit = limit
+
+    def __iter__(self):
+        remaining = self._limit
+        for query_set in self._get_query_sets():
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                query_set = query_set.limit(remaining)
+            for activity in query_set:
+                yield activity
+                if remaining is not None:
+                    remaining -= 1
+
+    def count(self):
+        return sum(query_set.count() for query_set in self._get_query_sets())
+
+    def filter(self, **filter_):
+        return self._clone(filters=(*self.filters, filter_))
+
+    def first(self):
+        return next(iter(self.limit(1)), None)
+
+    def limit(self, limit):
+        return self._clone(limit=limit)
+
+    def order_by(self, ordering):
+        if ordering not in ("id", "-id"):
+            raise ValueError("Partitioned activities can only be ordered by id.")
+        return self._clone(ordering=ordering)
+
+    def _clone(self, **kwargs):
+        return PartitionedQuerySet(**{
+            "activity_class": self.activity_class,
+            "filters": self.filters,
+            "limit": self._limit,
+            "ordering": self.ordering,
+            **kwargs,
+        })
+
+    def _get_partition_names(self):
+        bounds = {"lower": [], "upper": []}
+        for filter_ in self.filters:
+            for key, value in filter_.items():
+                if key in ID_BOUND_KEYS:
+                    bounds[ID_BOUND_KEYS[key]].append(
+                        self.activity_class.get_partition_name(value)
+                    )
+        lower = max(bounds["lower"], default=None)
+        upper = min(bounds["upper"], default=None)
+        partition_names = [
+            partition_name
+            for partition_name in self.activity_class.get_partition_names()
+            if (lower is None or partition_name >= lower)
+            and (upper is None or partition_name <= upper)
+        ]
+        base_name = self.activity_class._get_collection_name()
+        if self.ordering == "-id":
+            return [*reversed(partition_names), base_name]
+        return [base_name, *partition_names]
+
+    def _get_query_sets(self):
+        database = self.activity_class._get_db()
+        for partition_name in self._get_partition_names():
+            query_set = QuerySet(self.activity_class, database[partition_name])
+            for filter_ in self.filters:
+                query_set = query_set.filter(**filter_)
+            yield query_set.order_by(self.ordering)
@@ -4,5 +4,17 @@ from main.documents.activity import Activity
 
 
 class StaffActivity(Activity, DynamicDocument):
+    meta = {
+        "auto_create_index": False,
+        "index_background": True,
+        "indexes": [
+            ("object_id", "-id"),
+            ("organization_id", "-id"),
+            ("organization_id", "creator_id", "-id"),
+            ("organization_id", "creator_type", "-id"),
+            ("user_id", "-id"),
+        ],
+    }
+
     organization_id = IntField(required=True)
     user_id = IntField(required=True)
@@ -5,7 +5,7 @@ from factory import Faker, Sequence, SubFactory
 from factory.django import DjangoModelFactory
 
 from main.factories.organization_factory import OrganizationFactory
-from main.models import ZONE_CHOICES
+from main.zones import get_zone_codes
 
 
 class ShippingFactory(DjangoModelFactory):
@@ -17,6 +17,4 @@ class ShippingFactory(DjangoModelFactory):
     name = Sequence(lambda n: f"name-{choice(ascii_uppercase)}{n}")
     organization = SubFactory(OrganizationFactory)
     unit_fee = Faker("pydecimal", left_digits=2, positive=True, right_digits=4)
-    zones = Faker(
-        "random_choices", elements=[choice[0] for choice in ZONE_CHOICES], length=2
-    )
+    zones = Faker("random_choices", elements=sorted(get_zone_codes()), length=2)
@@ -1,4 +1,5 @@
-from django.db.models import QuerySet
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Exists, OuterRef, QuerySet
 from rest_framework.filters import BaseFilterBackend
 
 
@@ -8,8 +9,70 @@ class FilterBackend(BaseFilterBackend):
         if filter_set_class is not None:
             filter_set = filter_set_class(data=request.query_params, partial=True)
             filter_set.is_valid(raise_exception=True)
-            query_set = queryset.filter(**filter_set.validated_data)
-            if isinstance(queryset, QuerySet):
-                query_set = query_set.distinct()
-            return query_set
+            if not isinstance(queryset, QuerySet):
+                return queryset.filter(**filter_set.validated_data)
+            column_filter = {}
+            relation_filters = {}
+            for key, value in filter_set.validated_data.items():
+                relation = _get_multi_valued_relation(queryset.model, key)
+                if relation is None:
+                    column_filter[key] = value
+                    continue
+                prefix, field = relation
+                relation_filter = relation_filters.setdefault(prefix, (field, {}))[1]
+                lookup = key[len(prefix) + 2 :]
+                if not _has_field(field.related_model, lookup.partition("__")[0]):
+                    lookup = f"pk__{lookup}"
+                    value = _get_pk_value(value)
+                relation_filter[lookup] = value
+            queryset = queryset.filter(**column_filter)
+            for prefix, (field, relation_filter) in relation_filters.items():
+                queryset = queryset.filter(
+                    Exists(
+                        field.related_model.objects.filter(
+                            **{
+                                _get_remote_name(field): OuterRef(
+                                    prefix.rpartition("__")[0] or "pk"
+                                )
+                            },
+                            **relation_filter,
+                        )
+                    )
+                )
+            return queryset
         return queryset
+
+
+def _get_multi_valued_relation(model, key):
+    names = key.split("__")
+    for index, name in enumerate(names[:-1]):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation:
+            return None
+        if field.many_to_many or field.one_to_many:
+            return "__".join(names[: index + 1]), field
+        model = field.related_model
+    return None
+
+
+def _get_pk_value(value):
+    if isinstance(value, (list, tuple)):
+        return [getattr(item, "pk", item) for item in value]
+    return getattr(value, "pk", value)
+
+
+def _has_field(model, name):
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _get_remote_name(field):
+    if field.auto_created and not field.concrete:
+        return field.field.name
+    return field.related_query_name()
@@ -0,0 +1,46 @@
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import FloatField, Q
+from django.db.models.functions import Cast, Greatest
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+
+class SearchFilterBackend(BaseFilterBackend):
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = getattr(view, "search_fields", None)
+        term = request.query_params.get(self.search_param, "").strip()
+        if not search_fields or not term:
+            return queryset
+        search_filter = Q()
+        for search_field in search_fields:
+            search_filter |= Q(**{f"{search_field}__icontains": term})
+        similarities = [
+            TrigramSimilarity(search_field, term) for search_field in search_fields
+        ]
+        queryset = queryset.filter(search_filter).annotate(
+            search_rank=Cast(
+                similarities[0] if len(similarities) == 1 else Greatest(*similarities),
+                FloatField(),
+            )
+        )
+        if OrderingFilter.ordering_param not in request.query_params:
+            queryset = queryset.order_by("-search_rank", "id")
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        search_fields = getattr(view, "search_fields", None)
+        if not search_fields:
+            return []
+        return [
+            {
+                "description": (
+                    f"Matches {', '.join(search_fields)} and ranks the results by"
+                    " similarity unless ordering is given."
+                ),
+                "in": "query",
+                "name": self.search_param,
+                "required": False,
+                "schema": {"type": "string"},
+            }
+        ]
@@ -0,0 +1,20 @@
+from bson import ObjectId
+from rest_framework.fields import ChoiceField, DateTimeField, IntegerField
+from rest_framework.serializers import Serializer
+
+from main.shortcuts import ActivityType
+
+
+class ActivityFilterSet(Serializer):
+    created_at__gte = DateTimeField()
+    created_at__lt = DateTimeField()
+    creator_id = IntegerField()
+    creator_type = ChoiceField(choices=ActivityType.ALL)
+
+    def validate(self, data):
+        filter_ = {**data}
+        if "created_at__gte" in filter_:
+            filter_["id__gte"] = ObjectId.from_datetime(filter_.pop("created_at__gte"))
+        if "created_at__lt" in filter_:
+            filter_["id__lt"] = ObjectId.from_datetime(filter_.pop("created_at__lt"))
+        return filter_
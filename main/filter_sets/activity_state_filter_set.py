@@ -0,0 +1,6 @@
+from rest_framework.fields import DateTimeField
+from rest_framework.serializers import Serializer
+
+
+class ActivityStateFilterSet(Serializer):
+    at = DateTimeField()
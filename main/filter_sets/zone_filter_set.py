@@ -0,0 +1,8 @@
+from rest_framework.fields import CharField
+from rest_framework.serializers import Serializer
+
+from main.zones import validate_zone
+
+
+class ZoneFilterSet(Serializer):
+    zone = CharField(max_length=255, validators=[validate_zone])
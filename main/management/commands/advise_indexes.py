@@ -0,0 +1,135 @@
+import re
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, migrations
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+from django.db.models import Index
+
+from konbinein.urls import router
+
+RANGE_LOOKUPS = ("gt", "gte", "lt", "lte")
+
+
+class Command(BaseCommand):
+    help = "Propose indexes for the view sets' orderings and range filters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if any index is proposed.",
+        )
+        parser.add_argument(
+            "--write",
+            action="store_true",
+            help="Write a migration that adds the proposed indexes concurrently.",
+        )
+
+    def handle(self, *_args, **options):
+        operations = []
+        for model, field_names_list in self._get_proposals().items():
+            table = model._meta.db_table
+            with connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(cursor, table)
+                cursor.execute(
+                    "SELECT indexrelname, idx_scan FROM pg_stat_user_indexes"
+                    " WHERE relname = %s",
+                    (table,),
+                )
+                index_scans = dict(cursor.fetchall())
+            self.stdout.write(table)
+            for field_names in field_names_list:
+                columns = [model._meta.get_field(name).column for name in field_names]
+                description = f"({', '.join(columns)})"
+                name = _get_covering_index_name(constraints, columns)
+                if name is not None:
+                    self.stdout.write(
+                        f"  {description}: covered by {name}"
+                        f" scans={index_scans.get(name, 0)}"
+                    )
+                    continue
+                index = Index(fields=field_names)
+                index.set_name_with_model(model)
+                operations.append(
+                    AddIndexConcurrently(index=index, model_name=model._meta.model_name)
+                )
+                self.stdout.write(f"  {description}: proposed {index.name}")
+        if not operations:
+            return
+        if options["write"]:
+            self.stdout.write(
+                f"Wrote {self._write_migration(operations)}. Add the indexes to the"
+                " models' Meta.indexes so that the migration state stays in sync."
+            )
+        if options["check"]:
+            raise CommandError(f"{len(operations)} indexes are proposed.")
+
+    @staticmethod
+    def _get_proposals():
+        proposals = {}
+        for prefix, view_set, _basename in router.registry:
+            queryset = getattr(view_set, "queryset", None)
+            if queryset is None:
+                continue
+            model = queryset.model
+            scope_names = [
+                name
+                for name in re.findall(r"\(\?P<(\w+)_id>", prefix)
+                if _is_concrete_field(model, name)
+            ]
+            names = list(getattr(view_set, "ordering_fields", None) or ())
+            filter_set_class = getattr(view_set, "filter_set_class", None)
+            if filter_set_class is not None:
+                for key in filter_set_class().fields:
+                    name, _, lookup = key.partition("__")
+                    if lookup in RANGE_LOOKUPS:
+                        names.append(name)
+            field_names_list = proposals.setdefault(model, [])
+            for name in dict.fromkeys(names):
+                if name == "id" or not _is_concrete_field(model, name):
+                    continue
+                field_names = [*scope_names, name, "id"]
+                if field_names not in field_names_list:
+                    field_names_list.append(field_names)
+        return {model: names for model, names in proposals.items() if names}
+
+    @staticmethod
+    def _write_migration(operations):
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        leaf = loader.graph.leaf_nodes("main")[0]
+        migration = type(
+            "Migration",
+            (migrations.Migration,),
+            {"dependencies": [leaf], "operations": operations},
+        )(f"{int(leaf[1][:4]) + 1:04d}_advised_indexes", "main")
+        writer = MigrationWriter(migration)
+        with open(writer.path, "w") as file:
+            file.write(
+                writer.as_string().replace(
+                    "class Migration(migrations.Migration):\n",
+                    "class Migration(migrations.Migration):\n    atomic = False\n",
+                )
+            )
+        return writer.path
+
+
+def _get_covering_index_name(constraints, columns):
+    for name, constraint in constraints.items():
+        if not (constraint["index"] or constraint["unique"]):
+            continue
+        if constraint["columns"][: len(columns)] == columns or (
+            constraint["unique"] and constraint["columns"] == columns[:-1]
+        ):
+            return name
+    return None
+
+
+def _is_concrete_field(model, name):
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return field.concrete and not field.many_to_many
@@ -0,0 +1,63 @@
+from datetime import datetime
+from gzip import open as gzip_open
+from pathlib import Path
+
+from bson import ObjectId
+from bson.json_util import CANONICAL_JSON_OPTIONS, dumps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.documents import ACTIVITY_CLASSES
+
+
+class Command(BaseCommand):
+    help = (
+        "Export activity partitions older than the kept months to gzip-compressed"
+        " NDJSON files and drop them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--directory", default=settings.ACTIVITY_ARCHIVE_DIRECTORY, type=Path
+        )
+        parser.add_argument(
+            "--kept-months",
+            default=12,
+            help="Number of months, including the current one, to keep in Mongo.",
+            type=int,
+        )
+
+    def handle(self, *_args, **options):
+        directory = Path(options["directory"])
+        directory.mkdir(exist_ok=True, parents=True)
+        now = datetime.utcnow()
+        month_index = now.year * 12 + now.month - options["kept_months"]
+        oldest_kept_id = ObjectId.from_datetime(
+            datetime(month_index // 12, month_index % 12 + 1, 1)
+        )
+        for activity_class in ACTIVITY_CLASSES:
+            oldest_kept_partition_name = activity_class.get_partition_name(
+                oldest_kept_id
+            )
+            for partition_name in activity_class.get_partition_names():
+                if partition_name < oldest_kept_partition_name:
+                    self._archive(activity_class, partition_name, directory)
+
+    def _archive(self, activity_class, partition_name, directory):
+        collection = activity_class._get_db()[partition_name]
+        path = directory / f"{collection.name}.ndjson.gz"
+        if path.exists():
+            raise CommandError(f"{path} already exists.")
+        temporary_path = directory / f"{collection.name}.ndjson.gz.tmp"
+        document_count = 0
+        with gzip_open(temporary_path, "wt", encoding="utf-8") as file:
+            for document in collection.find().sort("_id"):
+                file.write(dumps(document, json_options=CANONICAL_JSON_OPTIONS))
+                file.write("\n")
+                document_count += 1
+        if document_count != collection.count_documents({}):
+            temporary_path.unlink()
+            raise CommandError(f"{collection.name} changed while being archived.")
+        temporary_path.rename(path)
+        activity_class.drop_partition(partition_name)
+        self.stdout.write(f"{collection.name}: {document_count} documents -> {path}")
@@ -0,0 +1,49 @@
+from time import perf_counter
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+
+from main.models.staff import Staff
+from main.models.user import User
+from main.permissions.organization_permission import OrganizationPermission
+from main.shortcuts import delete_staff_organization_ids
+
+
+class Command(BaseCommand):
+    help = "Compare organization permission check latency with and without cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("organization_id", type=int)
+        parser.add_argument("user_id", type=int)
+        parser.add_argument("--iterations", default=1000, type=int)
+
+    def handle(self, *_args, **options):
+        organization_id = options["organization_id"]
+        iterations = options["iterations"]
+        user = User.objects.get(id=options["user_id"])
+        request = SimpleNamespace(user=user)
+        view = SimpleNamespace(kwargs={"organization_id": str(organization_id)})
+        permission = OrganizationPermission()
+
+        def check_with_query():
+            Staff.objects.filter(
+                does_organization_agree=True,
+                does_user_agree=True,
+                organization=organization_id,
+                user=user.id,
+            ).exists()
+
+        def check_with_cache():
+            permission.has_permission(request, view)
+
+        delete_staff_organization_ids(user.id)
+        check_with_cache()
+        for name, check in (("query", check_with_query), ("cache", check_with_cache)):
+            started_at = perf_counter()
+            for _ in range(iterations):
+                check()
+            elapsed = perf_counter() - started_at
+            self.stdout.write(
+                f"{name}: {elapsed / iterations * 1_000_000:.1f}us per check"
+                f" ({iterations} iterations)"
+            )
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from main.order_imports import OrderImportStatus
+from main.shortcuts import get_order_import
+
+
+class Command(BaseCommand):
+    help = "Delete uploaded order import files whose import succeeded or expired."
+
+    def handle(self, *_args, **_options):
+        directory = settings.ORDER_IMPORT["directory"]
+        if not directory.exists():
+            return
+        for path in directory.iterdir():
+            order_import = get_order_import(path.name)
+            if (
+                order_import is None
+                or order_import["status"] == OrderImportStatus.SUCCEEDED
+            ):
+                path.unlink(missing_ok=True)
+                self.stdout.write(f"{path.name}: deleted")
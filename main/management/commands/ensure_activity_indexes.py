@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main.documents import ACTIVITY_CLASSES
+from main.documents.activity_snapshot import ActivitySnapshot
+
+
+class Command(BaseCommand):
+    help = "Create or verify activity and snapshot indexes and report their stats."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only verify the indexes and fail if any is missing.",
+        )
+
+    def handle(self, *_args, **options):
+        missing_count = 0
+        for document_class, collection in self._get_collections():
+            if not options["check"]:
+                document_class.ensure_collection_indexes(collection)
+            index_keys = {
+                tuple(index["key"]): name
+                for name, index in collection.index_information().items()
+            }
+            index_sizes, index_accesses = self._get_index_stats(collection)
+            self.stdout.write(collection.name)
+            for spec in document_class._meta["index_specs"]:
+                name = index_keys.get(tuple(spec["fields"]))
+                if name is None:
+                    missing_count += 1
+                    self.stdout.write(f"  {spec['fields']}: missing")
+                    continue
+                self.stdout.write(
+                    f"  {name}: size={index_sizes.get(name, 0)}"
+                    f" accesses={index_accesses.get(name, 0)}"
+                )
+        if missing_count:
+            raise CommandError(f"{missing_count} indexes are missing.")
+
+    @staticmethod
+    def _get_collections():
+        for activity_class in ACTIVITY_CLASSES:
+            database = activity_class._get_db()
+            yield activity_class, activity_class._get_collection()
+            for partition_name in activity_class.get_partition_names():
+                yield activity_class, database[partition_name]
+        yield ActivitySnapshot, ActivitySnapshot._get_collection()
+
+    @staticmethod
+    def _get_index_stats(collection):
+        if collection.name not in collection.database.list_collection_names():
+            return {}, {}
+        storage_stats = next(
+            collection.aggregate([{"$collStats": {"storageStats": {}}}])
+        )["storageStats"]
+        index_accesses = {
+            index_stats["name"]: index_stats["accesses"]["ops"]
+            for index_stats in collection.aggregate([{"$indexStats": {}}])
+        }
+        return storage_stats["indexSizes"], index_accesses
@@ -0,0 +1,47 @@
+from gzip import open as gzip_open
+from itertools import islice
+from pathlib import Path
+
+from bson.json_util import loads
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.documents import ACTIVITY_CLASSES
+
+
+class Command(BaseCommand):
+    help = "Restore an archived activity partition into Mongo."
+
+    def add_arguments(self, parser):
+        parser.add_argument("partition_name")
+        parser.add_argument("--batch-size", default=1000, type=int)
+        parser.add_argument(
+            "--directory", default=settings.ACTIVITY_ARCHIVE_DIRECTORY, type=Path
+        )
+
+    def handle(self, *_args, **options):
+        partition_name = options["partition_name"]
+        activity_class = next(
+            (
+                activity_class
+                for activity_class in ACTIVITY_CLASSES
+                if activity_class.is_partition_name(partition_name)
+            ),
+            None,
+        )
+        if activity_class is None:
+            raise CommandError(f"{partition_name} isn't an activity partition.")
+        path = Path(options["directory"]) / f"{partition_name}.ndjson.gz"
+        if not path.exists():
+            raise CommandError(f"{path} doesn't exist.")
+        collection = activity_class.get_partition_collection(partition_name)
+        if collection.estimated_document_count():
+            raise CommandError(f"{partition_name} already has documents.")
+        document_count = 0
+        with gzip_open(path, "rt", encoding="utf-8") as file:
+            while documents := [
+                loads(line) for line in islice(file, options["batch_size"])
+            ]:
+                collection.insert_many(documents, ordered=False)
+                document_count += len(documents)
+        self.stdout.write(f"{partition_name}: {document_count} documents <- {path}")
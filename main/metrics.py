@@ -0,0 +1,12 @@
+from collections import Counter
+
+counters = Counter()
+gauges = {}
+
+
+def increment_counter(name, value=1):
+    counters[name] += value
+
+
+def set_gauge(name, value):
+    gauges[name] = value
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:48
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main", "0038_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ordershipping",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["zones"], name="main_ordershipping_zones_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productshipping",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["zones"], name="main_productshipping_zones_gin"
+            ),
+        ),
+    ]
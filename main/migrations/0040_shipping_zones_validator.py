@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-18 07:51
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+import main.zones
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main", "0039_shipping_zones_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ordershipping",
+            name="zones",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=255),
+                size=None,
+                validators=[main.zones.validate_zones],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="productshipping",
+            name="zones",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=255),
+                size=None,
+                validators=[main.zones.validate_zones],
+            ),
+        ),
+    ]
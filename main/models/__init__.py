@@ -1,8 +1,8 @@
-from pycountry import countries, subdivisions
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 
 ALL_ZONE = "ALL"
-ZONE_CHOICES = (
-    (ALL_ZONE, "all"),
-    *((country.alpha_2, country.name) for country in countries),
-    *((subdivision.code, subdivision.name) for subdivision in subdivisions),
-)
+
+
+def get_trigram_index(field_name, name):
+    return GinIndex(OpClass(Upper(field_name), name="gin_trgm_ops"), name=name)
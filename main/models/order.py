@@ -8,6 +8,7 @@ from django.db.models import (
     UniqueConstraint,
 )
 
+from main.models import get_trigram_index
 from main.models.organization import Organization
 
 
@@ -20,6 +21,7 @@ class Order(Model):
                 name="main_order_code_organization_id",
             ),
         )
+        indexes = (get_trigram_index("code", "main_order_code_trgm"),)
 
     code = CharField(max_length=255)
     created_at = DateTimeField()
@@ -1,5 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db.models import UniqueConstraint
 
+from main.models import get_trigram_index
 from main.models.shipping import Shipping
 
 
@@ -12,3 +14,8 @@ class OrderShipping(Shipping):
                 name="main_order_shipping_code_organization_id",
             ),
         )
+        indexes = (
+            get_trigram_index("code", "main_ordershipping_code_trgm"),
+            get_trigram_index("name", "main_ordershipping_name_trgm"),
+            GinIndex(fields=("zones",), name="main_ordershipping_zones_gin"),
+        )
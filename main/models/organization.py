@@ -1,6 +1,14 @@
 from django.db.models import CharField, Model
 
+from main.models import get_trigram_index
+
 
 class Organization(Model):
+    class Meta:
+        indexes = (
+            get_trigram_index("code", "main_organization_code_trgm"),
+            get_trigram_index("name", "main_organization_name_trgm"),
+        )
+
     code = CharField(max_length=255, unique=True)
     name = CharField(max_length=255)
@@ -7,6 +7,7 @@ from django.db.models import (
     UniqueConstraint,
 )
 
+from main.models import get_trigram_index
 from main.models.organization import Organization
 
 
@@ -19,6 +20,10 @@ class Product(Model):
                 name="main_product_code_organization_id",
             ),
         )
+        indexes = (
+            get_trigram_index("code", "main_product_code_trgm"),
+            get_trigram_index("name", "main_product_name_trgm"),
+        )
 
     code = CharField(max_length=255)
     name = CharField(max_length=255)
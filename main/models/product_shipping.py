@@ -1,5 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db.models import ManyToManyField, UniqueConstraint
 
+from main.models import get_trigram_index
 from main.models.product import Product
 from main.models.shipping import Shipping
 
@@ -13,5 +15,10 @@ class ProductShipping(Shipping):
                 name="main_product_shipping_code_organization_id",
             ),
         )
+        indexes = (
+            get_trigram_index("code", "main_productshipping_code_trgm"),
+            get_trigram_index("name", "main_productshipping_name_trgm"),
+            GinIndex(fields=("zones",), name="main_productshipping_zones_gin"),
+        )
 
     products = ManyToManyField(Product, blank=True)
@@ -1,7 +1,15 @@
 from django.db.models import BooleanField, CharField, EmailField, Model
 
+from main.models import get_trigram_index
+
 
 class User(Model):
+    class Meta:
+        indexes = (
+            get_trigram_index("email", "main_user_email_trgm"),
+            get_trigram_index("name", "main_user_name_trgm"),
+        )
+
     email = EmailField(unique=True)
     hashed_password = CharField(max_length=255)
     is_system_administrator = BooleanField()
@@ -0,0 +1,166 @@
+from csv import DictReader
+from datetime import datetime
+from itertools import islice
+from json import JSONDecodeError, loads
+from time import monotonic
+from uuid import uuid4
+
+from celery import shared_task
+from django.conf import settings
+
+from main.activity_sinks import write_creation_activities
+from main.documents.order_activity import OrderActivity
+from main.serializers.order_serializer import OrderSerializer
+from main.shortcuts import ActivityType, get_order_import, set_order_import
+
+NESTED_FIELDS = ("ordershippingitem_set", "productitem_set")
+
+
+class OrderImportFormat:
+    CSV = "csv"
+    NDJSON = "ndjson"
+    ALL = (CSV, NDJSON)
+
+
+class OrderImportStatus:
+    FAILED = "failed"
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+
+
+def create_order_import(file, format_, organization_id, user_id):
+    order_import = {
+        "created_at": datetime.utcnow(),
+        "created_count": 0,
+        "error_count": 0,
+        "errors": [],
+        "format": format_,
+        "id": uuid4().hex,
+        "organization_id": int(organization_id),
+        "processed_row_count": 0,
+        "rows_per_second": None,
+        "status": OrderImportStatus.PENDING,
+        "updated_at": datetime.utcnow(),
+        "user_id": user_id,
+    }
+    set_order_import(order_import)
+    path = get_order_import_path(order_import["id"])
+    path.parent.mkdir(exist_ok=True, parents=True)
+    with open(path, "wb") as destination:
+        for chunk in file.chunks():
+            destination.write(chunk)
+    import_orders.delay(order_import["id"])
+    return order_import
+
+
+def get_order_import_path(order_import_id):
+    return settings.ORDER_IMPORT["directory"] / order_import_id
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def import_orders(order_import_id):
+    order_import = get_order_import(order_import_id)
+    if order_import is None or order_import["status"] == OrderImportStatus.SUCCEEDED:
+        get_order_import_path(order_import_id).unlink(missing_ok=True)
+        return
+    order_import["status"] = OrderImportStatus.RUNNING
+    _save(order_import)
+    started_at = monotonic()
+    started_row_count = order_import["processed_row_count"]
+    try:
+        with open(
+            get_order_import_path(order_import_id), encoding="utf-8", newline=""
+        ) as file:
+            rows = islice(
+                _read_rows(file, order_import["format"]),
+                order_import["processed_row_count"],
+                None,
+            )
+            while chunk := list(islice(rows, settings.ORDER_IMPORT["chunk_size"])):
+                _import_chunk(order_import, chunk)
+                elapsed = monotonic() - started_at
+                if elapsed:
+                    order_import["rows_per_second"] = (
+                        order_import["processed_row_count"] - started_row_count
+                    ) / elapsed
+                _save(order_import)
+    except Exception:
+        order_import["status"] = OrderImportStatus.FAILED
+        _save(order_import)
+        raise
+    order_import["status"] = OrderImportStatus.SUCCEEDED
+    _save(order_import)
+    get_order_import_path(order_import_id).unlink(missing_ok=True)
+
+
+def _import_chunk(order_import, chunk):
+    data_list = []
+    errors = {}
+    first_row_number = order_import["processed_row_count"] + 1
+    for row_number, row in enumerate(chunk, first_row_number):
+        try:
+            data_list.append(_parse_row(row, order_import["format"]))
+        except (JSONDecodeError, TypeError):
+            data_list.append(None)
+            errors[row_number] = {"non_field_errors": ["Row is malformed."]}
+    organization_id = order_import["organization_id"]
+    validated_data_list = []
+    valid_data_list = []
+    valid_row_numbers = []
+    for row_number, (data, (validated_data, row_errors)) in enumerate(
+        zip(data_list, OrderSerializer.validate_many(data_list, organization_id, {})),
+        first_row_number,
+    ):
+        if row_number in errors:
+            continue
+        if row_errors is not None:
+            errors[row_number] = row_errors
+            continue
+        validated_data_list.append(validated_data)
+        valid_data_list.append(data)
+        valid_row_numbers.append(row_number)
+    orders_and_data = []
+    for row_number, data, (order, row_errors) in zip(
+        valid_row_numbers,
+        valid_data_list,
+        OrderSerializer.create_many(validated_data_list, organization_id),
+    ):
+        if row_errors is not None:
+            errors[row_number] = row_errors
+            continue
+        orders_and_data.append((order, data))
+    write_creation_activities(
+        OrderActivity,
+        ActivityType.ORGANIZATION,
+        order_import["user_id"],
+        organization_id,
+        orders_and_data,
+    )
+    order_import["created_count"] += len(orders_and_data)
+    order_import["error_count"] += len(errors)
+    order_import["errors"] += [
+        {"errors": row_errors, "row": row_number}
+        for row_number, row_errors in sorted(errors.items())
+    ][: settings.ORDER_IMPORT["max_errors"] - len(order_import["errors"])]
+    order_import["processed_row_count"] += len(chunk)
+
+
+def _parse_row(row, format_):
+    if format_ == OrderImportFormat.NDJSON:
+        return loads(row)
+    return {
+        key: loads(value) if key in NESTED_FIELDS else value
+        for key, value in row.items()
+    }
+
+
+def _read_rows(file, format_):
+    if format_ == OrderImportFormat.NDJSON:
+        return (line for line in file if line.strip())
+    return DictReader(file)
+
+
+def _save(order_import):
+    order_import["updated_at"] = datetime.utcnow()
+    set_order_import(order_import)
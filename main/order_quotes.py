@@ -0,0 +1,194 @@
+from collections import OrderedDict, defaultdict
+from decimal import Decimal
+from operator import attrgetter
+from threading import Lock
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+
+from main.models.order_shipping import OrderShipping
+from main.models.product import Product
+from main.models.product_shipping import ProductShipping
+from main.shortcuts import get_pricing_version, set_pricing_version
+from main.zones import get_zone_ancestors
+
+AMOUNT_EXPONENT = Decimal("0.0001")
+
+_lock = Lock()
+_pricing_tables = OrderedDict()
+
+
+class PricingTables:
+    __slots__ = ("order_shipping_index", "product_shipping_index", "products")
+
+    def __init__(self, order_shippings, product_shippings, products):
+        self.order_shipping_index = _get_zone_index(order_shippings)
+        self.product_shipping_index = {
+            zone: _get_product_index(shippings)
+            for zone, shippings in _get_zone_index(product_shippings).items()
+        }
+        self.products = products
+
+    # Only the rules of the most specific zone apply, so an organization can
+    # override an ALL or a country rule for a subdivision.
+    def get_order_shippings(self, zone):
+        for ancestor in get_zone_ancestors(zone):
+            shippings = self.order_shipping_index.get(ancestor)
+            if shippings:
+                return shippings
+        return []
+
+    def get_product_shippings(self, zone, product_id):
+        for ancestor in get_zone_ancestors(zone):
+            shippings = self.product_shipping_index.get(ancestor, {}).get(product_id)
+            if shippings:
+                return shippings
+        return []
+
+
+class ShippingRate:
+    __slots__ = ("fixed_fee", "id", "name", "product_ids", "unit_fee", "zones")
+
+    def __init__(self, fixed_fee, id_, name, product_ids, unit_fee, zones):
+        self.fixed_fee = fixed_fee
+        self.id = id_
+        self.name = name
+        self.product_ids = product_ids
+        self.unit_fee = unit_fee
+        self.zones = zones
+
+    def get_item_data(self, field_name, quantity):
+        return {
+            "fixed_fee": _format(self.fixed_fee),
+            "item_total": _format(self.get_item_total(quantity)),
+            "name": self.name,
+            field_name: self.id,
+            "unit_fee": _format(self.unit_fee),
+        }
+
+    def get_item_total(self, quantity):
+        return self.fixed_fee + self.unit_fee * quantity
+
+
+def get_pricing_tables(organization_id):
+    organization_id = int(organization_id)
+    version = get_pricing_version(organization_id)
+    with _lock:
+        cached = _pricing_tables.get(organization_id)
+        if version is not None and cached is not None and cached[0] == version:
+            _pricing_tables.move_to_end(organization_id)
+            return cached[1]
+    if version is None:
+        version = set_pricing_version(organization_id)
+    product_ids_dict = defaultdict(set)
+    product_shipping_products = ProductShipping.products.through.objects.filter(
+        productshipping__organization=organization_id
+    ).values_list("productshipping_id", "product_id")
+    for product_shipping_id, product_id in product_shipping_products:
+        product_ids_dict[product_shipping_id].add(product_id)
+    pricing_tables = PricingTables(
+        [
+            ShippingRate(fixed_fee, id_, name, frozenset(), unit_fee, frozenset(zones))
+            for id_, fixed_fee, name, unit_fee, zones in _get_shipping_rows(
+                OrderShipping, organization_id
+            )
+        ],
+        [
+            ShippingRate(
+                fixed_fee,
+                id_,
+                name,
+                frozenset(product_ids_dict[id_]),
+                unit_fee,
+                frozenset(zones),
+            )
+            for id_, fixed_fee, name, unit_fee, zones in _get_shipping_rows(
+                ProductShipping, organization_id
+            )
+        ],
+        {
+            id_: (name, price)
+            for id_, name, price in Product.objects.filter(
+                organization=organization_id
+            ).values_list("id", "name", "price")
+        },
+    )
+    with _lock:
+        _pricing_tables[organization_id] = (version, pricing_tables)
+        _pricing_tables.move_to_end(organization_id)
+        while len(_pricing_tables) > settings.PRICING_TABLES_MAX_SIZE:
+            _pricing_tables.popitem(last=False)
+    return pricing_tables
+
+
+def quote_order(organization_id, item_data_list, zone):
+    pricing_tables = get_pricing_tables(organization_id)
+    product_item_data_list = []
+    product_shipping_total = Decimal(0)
+    product_total = Decimal(0)
+    for item_data in item_data_list:
+        product_id = item_data["product"]
+        quantity = item_data["quantity"]
+        if product_id not in pricing_tables.products:
+            raise ValidationError(detail="Product doesn't belong to the organization.")
+        name, price = pricing_tables.products[product_id]
+        item_total = price * quantity
+        product_shipping_item_data_list = []
+        for product_shipping in pricing_tables.get_product_shippings(zone, product_id):
+            product_shipping_item_data_list.append(
+                product_shipping.get_item_data("product_shipping", quantity)
+            )
+            product_shipping_total += product_shipping.get_item_total(quantity)
+        product_item_data_list.append({
+            "item_total": _format(item_total),
+            "name": name,
+            "price": _format(price),
+            "product": product_id,
+            "productshippingitem_set": product_shipping_item_data_list,
+            "quantity": quantity,
+        })
+        product_total += item_total
+    order_shipping_item_data_list = []
+    order_shipping_total = Decimal(0)
+    product_item_count = len(product_item_data_list)
+    for order_shipping in pricing_tables.get_order_shippings(zone):
+        order_shipping_item_data_list.append(
+            order_shipping.get_item_data("order_shipping", product_item_count)
+        )
+        order_shipping_total += order_shipping.get_item_total(product_item_count)
+    return {
+        "order_shipping_total": _format(order_shipping_total),
+        "ordershippingitem_set": order_shipping_item_data_list,
+        "product_shipping_total": _format(product_shipping_total),
+        "product_total": _format(product_total),
+        "productitem_set": product_item_data_list,
+        "total": _format(order_shipping_total + product_shipping_total + product_total),
+    }
+
+
+def _format(amount):
+    return str(amount.quantize(AMOUNT_EXPONENT))
+
+
+def _get_product_index(shippings):
+    product_index = defaultdict(list)
+    for shipping in shippings:
+        for product_id in shipping.product_ids:
+            product_index[product_id].append(shipping)
+    return dict(product_index)
+
+
+def _get_zone_index(shippings):
+    zone_index = defaultdict(list)
+    for shipping in sorted(shippings, key=attrgetter("id")):
+        for zone in shipping.zones:
+            zone_index[zone].append(shipping)
+    return dict(zone_index)
+
+
+def _get_shipping_rows(model, organization_id):
+    return (
+        model.objects.filter(organization=organization_id)
+        .order_by("id")
+        .values_list("id", "fixed_fee", "name", "unit_fee", "zones")
+    )
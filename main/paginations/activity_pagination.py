@@ -0,0 +1,67 @@
+from heapq import merge
+from itertools import islice
+from operator import attrgetter
+
+from bson import ObjectId
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class ActivityPagination(BasePagination):
+    cursor_query_param = "cursor"
+    default_limit = 100
+    limit_query_param = "limit"
+    max_limit = 1000
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            str(self.next_cursor),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def paginate_querysets(self, querysets, request):
+        self.request = request
+        limit = self._get_limit(request)
+        cursor = self._get_cursor(request)
+        if cursor is not None:
+            querysets = [queryset.filter(id__lt=cursor) for queryset in querysets]
+        activities = list(
+            islice(
+                merge(
+                    *(
+                        queryset.order_by("-id").limit(limit + 1)
+                        for queryset in querysets
+                    ),
+                    key=attrgetter("id"),
+                    reverse=True,
+                ),
+                limit + 1,
+            )
+        )
+        self.next_cursor = activities[limit - 1].id if len(activities) > limit else None
+        return activities[:limit]
+
+    def _get_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor is None:
+            return None
+        if not ObjectId.is_valid(cursor):
+            raise NotFound("Invalid cursor.")
+        return ObjectId(cursor)
+
+    def _get_limit(self, request):
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
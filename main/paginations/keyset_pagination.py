@@ -0,0 +1,147 @@
+from django.core.signing import BadSignature, dumps, loads
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from main.paginations.pagination import Pagination
+
+
+class KeysetPagination(Pagination):
+    cursor_query_param = "cursor"
+    cursor_salt = "main.paginations.keyset_pagination"
+    is_keyset = False
+
+    def get_next_link(self):
+        if not self.is_keyset:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_paginated_response(self, data):
+        if not self.is_keyset:
+            return super().get_paginated_response(data)
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            **super().get_paginated_response_schema(schema),
+            "required": ["results"],
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "description": (
+                    "The cursor of the next page. An empty cursor starts keyset"
+                    " pagination, which returns no count or previous link."
+                ),
+                "in": "query",
+                "name": self.cursor_query_param,
+                "required": False,
+                "schema": {"type": "string"},
+            },
+        ]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.is_keyset = self.cursor_query_param in request.query_params
+        if not self.is_keyset:
+            return super().paginate_queryset(queryset, request, view)
+        self.request = request
+        self.limit = self.get_limit(request)
+        ordering = self._get_ordering(request, queryset, view)
+        names = [term.lstrip("-") for term in ordering]
+        queryset = queryset.order_by(*ordering)
+        fields = queryset._fields
+        if fields:
+            missing_names = [name for name in names if name not in fields]
+            if missing_names:
+                fields = (*fields, *missing_names)
+                queryset = queryset.values_list(*fields)
+        cursor = request.query_params[self.cursor_query_param]
+        if cursor:
+            queryset = queryset.filter(
+                self._get_cursor_filter(
+                    ordering, self._decode_cursor(cursor, ordering, queryset)
+                )
+            )
+        rows = list(queryset[: self.limit + 1])
+        if len(rows) > self.limit:
+            row = rows[self.limit - 1]
+            self.next_cursor = self._encode_cursor(
+                ordering,
+                [
+                    row[fields.index(name)] if fields else getattr(row, name)
+                    for name in names
+                ],
+            )
+        else:
+            self.next_cursor = None
+        return rows[: self.limit]
+
+    def _decode_cursor(self, cursor, ordering, queryset):
+        try:
+            payload = loads(cursor, salt=self.cursor_salt)
+        except BadSignature:
+            raise NotFound("Invalid cursor.")
+        if payload["ordering"] != ordering:
+            raise NotFound("Invalid cursor.")
+        return [
+            None if value is None else _get_field(queryset, term).to_python(value)
+            for term, value in zip(ordering, payload["values"])
+        ]
+
+    def _encode_cursor(self, ordering, values):
+        return dumps(
+            {
+                "ordering": ordering,
+                "values": [None if value is None else str(value) for value in values],
+            },
+            salt=self.cursor_salt,
+        )
+
+    @staticmethod
+    def _get_cursor_filter(ordering, values):
+        cursor_filter = Q()
+        for index, term in enumerate(ordering):
+            lookup = "lt" if term.startswith("-") else "gt"
+            cursor_filter |= Q(
+                **{
+                    previous_term.lstrip("-"): value
+                    for previous_term, value in zip(ordering[:index], values)
+                },
+                **{f"{term.lstrip('-')}__{lookup}": values[index]},
+            )
+        return cursor_filter
+
+    @staticmethod
+    def _get_ordering(request, queryset, view):
+        ordering = []
+        for filter_backend in getattr(view, "filter_backends", ()):
+            if issubclass(filter_backend, OrderingFilter):
+                ordering = list(
+                    filter_backend().get_ordering(request, queryset, view) or ()
+                )
+                break
+        if not ordering:
+            ordering = [
+                term for term in queryset.query.order_by if isinstance(term, str)
+            ]
+        if "id" not in ordering and "-id" not in ordering:
+            ordering.append("id")
+        return ordering
+
+
+def _get_field(queryset, term):
+    name = term.lstrip("-")
+    annotation = queryset.query.annotations.get(name)
+    if annotation is not None:
+        return annotation.output_field
+    return queryset.model._meta.get_field(name)
@@ -1,6 +1,104 @@
+from hashlib import sha256
+from json import loads
+
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import replace_query_param
+
+from main.shortcuts import get_pagination_count, set_pagination_count
+
+
+class PaginationCount:
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+    EXACT = "exact"
+    NONE = "none"
+    ALL = (CACHED, ESTIMATE, EXACT, NONE)
 
 
 class Pagination(LimitOffsetPagination):
+    count_query_param = "count"
     default_limit = 100
     max_limit = 1000
+
+    def get_count(self, queryset):
+        if self.count_mode == PaginationCount.EXACT:
+            return super().get_count(queryset)
+        try:
+            if self.count_mode == PaginationCount.ESTIMATE:
+                return _estimate_count(queryset)
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        key = sha256(repr((sql, params)).encode()).hexdigest()
+        count = get_pagination_count(self.organization_id, key)
+        if count is None:
+            count = super().get_count(queryset)
+            set_pagination_count(self.organization_id, key, count)
+        return count
+
+    def get_next_link(self):
+        if self.count_mode == PaginationCount.EXACT:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = replace_query_param(
+            self.request.build_absolute_uri(), self.limit_query_param, self.limit
+        )
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"]["nullable"] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "description": (
+                    "How to count the results. Defaults to exact, while cached may"
+                    " be a few seconds stale."
+                ),
+                "in": "query",
+                "name": self.count_query_param,
+                "required": False,
+                "schema": {"enum": PaginationCount.ALL, "type": "string"},
+            },
+        ]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_mode = request.query_params.get(self.count_query_param)
+        if self.count_mode not in PaginationCount.ALL:
+            self.count_mode = PaginationCount.EXACT
+        self.organization_id = getattr(view, "kwargs", {}).get("organization_id")
+        if self.count_mode == PaginationCount.EXACT:
+            return super().paginate_queryset(queryset, request, view)
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+        self.count = (
+            None
+            if self.count_mode == PaginationCount.NONE
+            else self.get_count(queryset)
+        )
+        rows = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(rows) > self.limit
+        return rows[: self.limit]
+
+
+def _estimate_count(queryset):
+    connection = connections[queryset.db]
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                (queryset.model._meta.db_table,),
+            )
+            row = cursor.fetchone()
+        if row is not None and row[0] >= 0:
+            return int(row[0])
+    return loads(queryset.order_by().explain(format="json"))[0]["Plan"]["Plan Rows"]
@@ -0,0 +1,79 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from time import perf_counter
+
+from django import setup
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework.exceptions import APIException
+from rest_framework.status import HTTP_503_SERVICE_UNAVAILABLE
+
+from main.metrics import increment_counter, set_gauge
+
+_executor = None
+_lock = Lock()
+_pending_count = 0
+
+
+class PasswordHashingUnavailable(APIException):
+    default_code = "password_hashing_unavailable"
+    default_detail = "Password hashing is busy, try again later."
+    status_code = HTTP_503_SERVICE_UNAVAILABLE
+
+
+def check_password(password, encoded):
+    return _run(hashers.check_password, password, encoded)
+
+
+def make_password(password):
+    return _run(hashers.make_password, password)
+
+
+def _acquire():
+    global _executor, _pending_count
+    with _lock:
+        if _pending_count >= settings.PASSWORD_HASHING["max_pending"]:
+            return None
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                initializer=setup,
+                max_workers=settings.PASSWORD_HASHING["max_workers"],
+            )
+        _pending_count += 1
+        set_gauge("password_hashing.queue_depth", _pending_count)
+        return _executor
+
+
+def _discard(executor):
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def _release():
+    global _pending_count
+    with _lock:
+        _pending_count -= 1
+        set_gauge("password_hashing.queue_depth", _pending_count)
+
+
+def _run(function, *args):
+    executor = _acquire()
+    if executor is None:
+        increment_counter("password_hashing.rejected")
+        raise PasswordHashingUnavailable()
+    started_at = perf_counter()
+    try:
+        return executor.submit(function, *args).result()
+    except BrokenProcessPool:
+        # A worker died, so the next call starts a fresh pool.
+        _discard(executor)
+        increment_counter("password_hashing.broken")
+        raise PasswordHashingUnavailable()
+    finally:
+        _release()
+        increment_counter("password_hashing.count")
+        increment_counter("password_hashing.seconds", perf_counter() - started_at)
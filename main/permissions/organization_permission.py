@@ -1,16 +1,24 @@
 from rest_framework.permissions import BasePermission
 
 from main.models.staff import Staff
+from main.shortcuts import get_staff_organization_ids, set_staff_organization_ids
 
 
 class OrganizationPermission(BasePermission):
     def has_permission(self, request, view):
-        return (
-            request.user is not None
-            and Staff.objects.filter(
-                does_organization_agree=True,
-                does_user_agree=True,
-                organization=view.kwargs["organization_id"],
-                user=request.user.id,
-            ).exists()
-        )
+        return request.user is not None and view.kwargs[
+            "organization_id"
+        ] in self.get_organization_ids(request.user.id)
+
+    @staticmethod
+    def get_organization_ids(user_id):
+        organization_ids = get_staff_organization_ids(user_id)
+        if organization_ids is None:
+            organization_ids = frozenset(
+                str(organization_id)
+                for organization_id in Staff.objects.filter(
+                    does_organization_agree=True, does_user_agree=True, user=user_id
+                ).values_list("organization_id", flat=True)
+            )
+            set_staff_organization_ids(user_id, organization_ids)
+        return organization_ids
@@ -1,17 +1,74 @@
-def _write_nested_objects(
-    data_list,
-    object_dict,
-    parent_key,
-    parent_object,
-    partial,
-    serializer_class,
-):
-    for data in data_list:
-        id_ = data.get("id")
+from rest_framework.relations import PrimaryKeyRelatedField
+
+
+class _OrganizationRelatedField(PrimaryKeyRelatedField):
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .filter(organization=self.context["view"].kwargs["organization_id"])
+        )
+
+    def to_internal_value(self, data):
+        related_objects = self.context.get("related_objects", {}).get(
+            self.queryset.model
+        )
+        if related_objects is None:
+            return super().to_internal_value(data)
+        try:
+            return related_objects[int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+def _get_related_objects(organization_id, model, ids):
+    valid_ids = set()
+    for id_ in ids:
+        try:
+            valid_ids.add(int(id_))
+        except (TypeError, ValueError):
+            pass
+    return model.objects.filter(organization=organization_id).in_bulk(valid_ids)
+
+
+def _get_nested_data_list(data, field_name):
+    data_list = data.get(field_name)
+    if not isinstance(data_list, list):
+        return []
+    return [nested_data for nested_data in data_list if isinstance(nested_data, dict)]
+
+
+def _write_nested_objects(attributes_list, model, object_dict):
+    created_objects = []
+    objects = []
+    updated_fields = set()
+    updated_objects = []
+    for attributes in attributes_list:
+        attributes = {**attributes}
+        id_ = attributes.pop("id", None)
         if id_ is None:
-            serializer_class().create({**data, parent_key: parent_object})
+            object_ = model(**attributes)
+            created_objects.append(object_)
         else:
-            serializer_class(partial=partial).update(object_dict[id_], data)
-    for id_, object_ in object_dict.items():
-        if id_ not in (data.get("id") for data in data_list):
-            object_.delete()
+            object_ = object_dict[id_]
+            fields = set()
+            for key, value in attributes.items():
+                attname = model._meta.get_field(key).attname
+                value = getattr(value, "pk", value)
+                if getattr(object_, attname) != value:
+                    setattr(object_, attname, value)
+                    fields.add(attname)
+            if fields:
+                updated_fields |= fields
+                updated_objects.append(object_)
+        objects.append(object_)
+    model.objects.bulk_create(created_objects)
+    if updated_objects:
+        model.objects.bulk_update(updated_objects, updated_fields)
+    ids = {object_.id for object_ in objects}
+    deleted_ids = [id_ for id_ in object_dict if id_ not in ids]
+    if deleted_ids:
+        model.objects.filter(id__in=deleted_ids).delete()
+    return objects
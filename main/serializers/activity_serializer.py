@@ -0,0 +1,23 @@
+from rest_framework.fields import (
+    CharField,
+    DateTimeField,
+    DictField,
+    IntegerField,
+    SerializerMethodField,
+)
+from rest_framework.serializers import Serializer
+
+
+class ActivitySerializer(Serializer):
+    created_at = DateTimeField(read_only=True, source="id.generation_time")
+    creator_id = IntegerField(read_only=True)
+    creator_organization_id = IntegerField(read_only=True)
+    creator_type = CharField(read_only=True)
+    data = DictField(read_only=True)
+    id = CharField(read_only=True)
+    object_id = IntegerField(read_only=True)
+    object_type = SerializerMethodField()
+
+    @staticmethod
+    def get_object_type(activity):
+        return activity._get_collection_name().removesuffix("_activity")
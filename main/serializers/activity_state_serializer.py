@@ -0,0 +1,8 @@
+from rest_framework.fields import DateTimeField, DictField, IntegerField
+from rest_framework.serializers import Serializer
+
+
+class ActivityStateSerializer(Serializer):
+    at = DateTimeField(read_only=True)
+    data = DictField(read_only=True)
+    object_id = IntegerField(read_only=True)
@@ -0,0 +1,9 @@
+from rest_framework.serializers import Serializer
+
+from main.serializers.order_shipping_serializer import OrderShippingSerializer
+from main.serializers.product_shipping_serializer import ProductShippingSerializer
+
+
+class ApplicableShippingSerializer(Serializer):
+    order_shippings = OrderShippingSerializer(many=True)
+    product_shippings = ProductShippingSerializer(many=True)
@@ -0,0 +1,10 @@
+from rest_framework.fields import DictField, IntegerField
+from rest_framework.serializers import Serializer
+
+from main.serializers.order_serializer import OrderSerializer
+
+
+class OrderBatchResultSerializer(Serializer):
+    data = OrderSerializer(read_only=True, required=False)
+    errors = DictField(read_only=True, required=False)
+    status = IntegerField(read_only=True)
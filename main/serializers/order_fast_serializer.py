@@ -0,0 +1,116 @@
+from collections import defaultdict
+from functools import cache
+
+from rest_framework.relations import RelatedField
+from rest_framework.serializers import ListSerializer
+
+from main.models.order import Order
+from main.serializers.order_serializer import OrderSerializer
+
+
+class OrderFastSerializer:
+    def __init__(self, instance, field_names=None, many=False):
+        self.field_names = field_names
+        self.instance = instance
+        self.many = many
+
+    @property
+    def data(self):
+        level = _get_level(OrderSerializer, Order, self.field_names)
+        rows = [
+            _Row(values)
+            for values in (self.instance if self.many else (self.instance,))
+        ]
+        _load_children(rows, level)
+        data_list = [_represent(row, level) for row in rows]
+        return data_list if self.many else data_list[0]
+
+    @staticmethod
+    def get_columns(field_names=None):
+        return _get_level(OrderSerializer, Order, field_names).columns
+
+
+class _Level:
+    __slots__ = ("columns", "fields", "relations")
+
+    def __init__(self, columns, fields, relations):
+        self.columns = columns
+        self.fields = fields
+        self.relations = relations
+
+
+class _Row:
+    __slots__ = ("children", "values")
+
+    def __init__(self, values):
+        self.children = {}
+        self.values = values
+
+
+@cache
+def _get_level(serializer_class, model, field_names=None):
+    columns = ["id"]
+    fields = []
+    relations = []
+    for name, field in serializer_class().fields.items():
+        if field.write_only or (field_names is not None and name not in field_names):
+            continue
+        if isinstance(field, ListSerializer):
+            relation = next(
+                relation
+                for relation in model._meta.related_objects
+                if relation.get_accessor_name() == field.source
+            )
+            child_level = _get_level(type(field.child), relation.related_model)
+            fields.append((name, None, None, child_level))
+            relations.append(
+                (name, relation.related_model, relation.field.attname, child_level)
+            )
+            continue
+        if isinstance(field, RelatedField):
+            column = model._meta.get_field(field.source).attname
+            represent = _represent_pk
+        else:
+            column = field.source
+            represent = field.to_representation
+        if column not in columns:
+            columns.append(column)
+        fields.append((name, columns.index(column), represent, None))
+    return _Level(tuple(columns), tuple(fields), tuple(relations))
+
+
+def _load_children(rows, level):
+    if not rows:
+        return
+    ids = [row.values[0] for row in rows]
+    for name, model, parent_column, child_level in level.relations:
+        child_rows = []
+        children = defaultdict(list)
+        for values in (
+            model.objects.filter(**{f"{parent_column}__in": ids})
+            .order_by("id")
+            .values_list(parent_column, *child_level.columns)
+        ):
+            child_row = _Row(values[1:])
+            child_rows.append(child_row)
+            children[values[0]].append(child_row)
+        for row in rows:
+            row.children[name] = children.get(row.values[0], ())
+        _load_children(child_rows, child_level)
+
+
+def _represent(row, level):
+    data = {}
+    for name, index, represent, child_level in level.fields:
+        if child_level is not None:
+            data[name] = [
+                _represent(child, child_level) for child in row.children[name]
+            ]
+            continue
+        value = row.values[index]
+        data[name] = None if value is None else represent(value)
+    return data
+
+
+def _represent_pk(value):
+    return value
@@ -0,0 +1,27 @@
+from rest_framework.fields import (
+    CharField,
+    ChoiceField,
+    DateTimeField,
+    DictField,
+    FileField,
+    FloatField,
+    IntegerField,
+    ListField,
+)
+from rest_framework.serializers import Serializer
+
+from main.order_imports import OrderImportFormat
+
+
+class OrderImportSerializer(Serializer):
+    created_at = DateTimeField(read_only=True)
+    created_count = IntegerField(read_only=True)
+    error_count = IntegerField(read_only=True)
+    errors = ListField(child=DictField(), read_only=True)
+    file = FileField(write_only=True)
+    format = ChoiceField(choices=OrderImportFormat.ALL)
+    id = CharField(read_only=True)
+    processed_row_count = IntegerField(read_only=True)
+    rows_per_second = FloatField(read_only=True)
+    status = CharField(read_only=True)
+    updated_at = DateTimeField(read_only=True)
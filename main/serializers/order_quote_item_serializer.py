@@ -0,0 +1,7 @@
+from rest_framework.fields import IntegerField
+from rest_framework.serializers import Serializer
+
+
+class OrderQuoteItemSerializer(Serializer):
+    product = IntegerField()
+    quantity = IntegerField(min_value=1)
@@ -0,0 +1,10 @@
+from rest_framework.fields import CharField
+from rest_framework.serializers import Serializer
+
+from main.serializers.order_quote_item_serializer import OrderQuoteItemSerializer
+from main.zones import validate_zone
+
+
+class OrderQuoteSerializer(Serializer):
+    items = OrderQuoteItemSerializer(allow_empty=False, many=True)
+    zone = CharField(max_length=255, validators=[validate_zone])
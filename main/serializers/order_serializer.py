@@ -1,11 +1,23 @@
 from decimal import Decimal
 
+from django.db import IntegrityError
+from django.db.models import prefetch_related_objects
 from django.db.transaction import atomic
 from rest_framework.exceptions import ValidationError
 from rest_framework.serializers import ModelSerializer
 
 from main.models.order import Order
-from main.serializers import _write_nested_objects
+from main.models.order_shipping import OrderShipping
+from main.models.order_shipping_item import OrderShippingItem
+from main.models.product import Product
+from main.models.product_item import ProductItem
+from main.models.product_shipping import ProductShipping
+from main.models.product_shipping_item import ProductShippingItem
+from main.serializers import (
+    _get_nested_data_list,
+    _get_related_objects,
+    _write_nested_objects,
+)
 from main.serializers.order_shipping_item_serializer import OrderShippingItemSerializer
 from main.serializers.product_item_serializer import ProductItemSerializer
 
@@ -30,29 +42,109 @@ class OrderSerializer(ModelSerializer):
 
     @atomic
     def create(self, validated_data):
-        order_attributes = {
-            **validated_data,
-            "organization_id": self.context["view"].kwargs["organization_id"],
-        }
-        order_shipping_item_data_list = order_attributes.pop(
-            "ordershippingitem_set", ()
-        )
-        product_item_data_list = order_attributes.pop("productitem_set", ())
-        order = super().create(order_attributes)
-        _write_nested_objects(
-            order_shipping_item_data_list,
-            {},
-            "order",
-            order,
-            False,
-            OrderShippingItemSerializer,
-        )
-        _write_nested_objects(
-            product_item_data_list, {}, "order", order, False, ProductItemSerializer
+        ((order, errors),) = self.create_many(
+            (validated_data,), self.context["view"].kwargs["organization_id"]
         )
+        if errors is not None:
+            raise ValidationError(detail=errors)
         return order
 
+    @classmethod
+    @atomic
+    def create_many(cls, validated_data_list, organization_id):
+        try:
+            with atomic():
+                orders = cls._create_orders(validated_data_list, organization_id)
+            return [(order, None) for order in orders]
+        except IntegrityError:
+            pass
+        # A concurrent request took some of the codes, so find them order by order.
+        results = []
+        for validated_data in validated_data_list:
+            try:
+                with atomic():
+                    (order,) = cls._create_orders((validated_data,), organization_id)
+            except IntegrityError:
+                if not Order.objects.filter(
+                    code=validated_data["code"], organization=organization_id
+                ).exists():
+                    raise
+                results.append((None, {"code": ["Code is already in another order."]}))
+                continue
+            results.append((order, None))
+        return results
+
+    @classmethod
+    def validate_many(cls, data_list, organization_id, context):
+        order_data_list = [data for data in data_list if isinstance(data, dict)]
+        context = {
+            **context,
+            "existing_codes": cls.get_existing_codes(
+                organization_id,
+                [
+                    data["code"]
+                    for data in order_data_list
+                    if isinstance(data.get("code"), str)
+                ],
+            ),
+            "related_objects": cls.get_related_objects(
+                organization_id, order_data_list
+            ),
+        }
+        results = []
+        for data in data_list:
+            if not isinstance(data, dict):
+                results.append((None, {"non_field_errors": ["Expected an order."]}))
+                continue
+            serializer = cls(context=context, data=data)
+            if not serializer.is_valid():
+                results.append((None, serializer.errors))
+                continue
+            context["existing_codes"].add(serializer.validated_data["code"])
+            results.append((serializer.validated_data, None))
+        return results
+
+    @staticmethod
+    def get_existing_codes(organization_id, codes):
+        return set(
+            Order.objects.filter(
+                code__in=codes, organization=organization_id
+            ).values_list("code", flat=True)
+        )
+
+    @staticmethod
+    def get_related_objects(organization_id, data_list):
+        order_shipping_ids = []
+        product_ids = []
+        product_shipping_ids = []
+        for data in data_list:
+            for order_shipping_item_data in _get_nested_data_list(
+                data, "ordershippingitem_set"
+            ):
+                order_shipping_ids.append(
+                    order_shipping_item_data.get("order_shipping")
+                )
+            for product_item_data in _get_nested_data_list(data, "productitem_set"):
+                product_ids.append(product_item_data.get("product"))
+                for product_shipping_item_data in _get_nested_data_list(
+                    product_item_data, "productshippingitem_set"
+                ):
+                    product_shipping_ids.append(
+                        product_shipping_item_data.get("product_shipping")
+                    )
+        return {
+            OrderShipping: _get_related_objects(
+                organization_id, OrderShipping, order_shipping_ids
+            ),
+            Product: _get_related_objects(organization_id, Product, product_ids),
+            ProductShipping: _get_related_objects(
+                organization_id, ProductShipping, product_shipping_ids
+            ),
+        }
+
     def to_internal_value(self, data):
+        if not isinstance(data, dict):
+            return super().to_internal_value(data)
         order_shipping_items = (
             [] if self.instance is None else self.instance.ordershippingitem_set.all()
         )
@@ -60,23 +152,42 @@ class OrderSerializer(ModelSerializer):
             order_shipping_item.id: order_shipping_item
             for order_shipping_item in order_shipping_items
         }
-        for order_shipping_item_data in data["ordershippingitem_set"]:
+        product_item_data_list = _get_nested_data_list(data, "productitem_set")
+        for order_shipping_item_data in _get_nested_data_list(
+            data, "ordershippingitem_set"
+        ):
             order_shipping_item_data["instance"] = order_shipping_item_dict.get(
                 order_shipping_item_data.get("id")
             )
-            order_shipping_item_data["quantity"] = len(data["productitem_set"])
+            order_shipping_item_data["quantity"] = len(product_item_data_list)
         product_items = (
-            [] if self.instance is None else self.instance.productitem_set.all()
+            []
+            if self.instance is None
+            else self.instance.productitem_set.prefetch_related(
+                "productshippingitem_set"
+            )
         )
         product_item_dict = {
             product_item.id: product_item for product_item in product_items
         }
-        for product_item_data in data["productitem_set"]:
+        for product_item_data in product_item_data_list:
             product_item_data["instance"] = product_item_dict.get(
                 product_item_data.get("id")
             )
+        if "related_objects" not in self.context:
+            self.context["related_objects"] = self.get_related_objects(
+                self.context["view"].kwargs["organization_id"], (data,)
+            )
         return super().to_internal_value(data)
 
+    def to_representation(self, instance):
+        prefetch_related_objects(
+            (instance,),
+            "ordershippingitem_set",
+            "productitem_set__productshippingitem_set",
+        )
+        return super().to_representation(instance)
+
     @atomic
     def update(self, instance, validated_data):
         order_attributes = {
@@ -95,22 +206,25 @@ class OrderSerializer(ModelSerializer):
             product_item.id: product_item
             for product_item in instance.productitem_set.all()
         }
+        product_shipping_item_dict = {
+            product_shipping_item.id: product_shipping_item
+            for product_shipping_item in ProductShippingItem.objects.filter(
+                product_item__order=instance
+            )
+        }
         order = super().update(instance, order_attributes)
-        _write_nested_objects(
-            order_shipping_item_data_list,
+        self._write_items(
+            [
+                {**order_shipping_item_data, "order": order}
+                for order_shipping_item_data in order_shipping_item_data_list
+            ],
             order_shipping_item_dict,
-            "order",
-            order,
-            self.partial,
-            OrderShippingItemSerializer,
-        )
-        _write_nested_objects(
-            product_item_data_list,
+            [
+                {**product_item_data, "order": order}
+                for product_item_data in product_item_data_list
+            ],
             product_item_dict,
-            "order",
-            order,
-            self.partial,
-            ProductItemSerializer,
+            product_shipping_item_dict,
         )
         return order
 
@@ -144,6 +258,11 @@ class OrderSerializer(ModelSerializer):
         return data
 
     def validate_code(self, value):
+        existing_codes = self.context.get("existing_codes")
+        if existing_codes is not None:
+            if value in existing_codes:
+                raise ValidationError(detail="Code is already in another order.")
+            return value
         query_set = Order.objects.filter(
             code=value, organization=self.context["view"].kwargs["organization_id"]
         )
@@ -152,3 +271,68 @@ class OrderSerializer(ModelSerializer):
         if query_set.exists():
             raise ValidationError(detail="Code is already in another order.")
         return value
+
+    @classmethod
+    def _create_orders(cls, validated_data_list, organization_id):
+        order_shipping_item_attributes_list = []
+        orders = []
+        product_item_attributes_list = []
+        for validated_data in validated_data_list:
+            order_attributes = {**validated_data, "organization_id": organization_id}
+            order = Order(**{
+                key: value
+                for key, value in order_attributes.items()
+                if key not in ("ordershippingitem_set", "productitem_set")
+            })
+            order_shipping_item_attributes_list += [
+                {**order_shipping_item_data, "order": order}
+                for order_shipping_item_data in order_attributes.get(
+                    "ordershippingitem_set", ()
+                )
+            ]
+            product_item_attributes_list += [
+                {**product_item_data, "order": order}
+                for product_item_data in order_attributes.get("productitem_set", ())
+            ]
+            orders.append(order)
+        Order.objects.bulk_create(orders)
+        cls._write_items(
+            order_shipping_item_attributes_list,
+            {},
+            product_item_attributes_list,
+            {},
+            {},
+        )
+        return orders
+
+    @staticmethod
+    def _write_items(
+        order_shipping_item_attributes_list,
+        order_shipping_item_dict,
+        product_item_attributes_list,
+        product_item_dict,
+        product_shipping_item_dict,
+    ):
+        _write_nested_objects(
+            order_shipping_item_attributes_list,
+            OrderShippingItem,
+            order_shipping_item_dict,
+        )
+        product_shipping_item_data_lists = [
+            product_item_attributes.pop("productshippingitem_set", ())
+            for product_item_attributes in product_item_attributes_list
+        ]
+        product_items = _write_nested_objects(
+            product_item_attributes_list, ProductItem, product_item_dict
+        )
+        _write_nested_objects(
+            [
+                {**product_shipping_item_data, "product_item": product_item}
+                for product_item, product_shipping_item_data_list in zip(
+                    product_items, product_shipping_item_data_lists
+                )
+                for product_shipping_item_data in product_shipping_item_data_list
+            ],
+            ProductShippingItem,
+            product_shipping_item_dict,
+        )
@@ -2,11 +2,11 @@ from decimal import Decimal
 
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import IntegerField
-from rest_framework.relations import PrimaryKeyRelatedField
 from rest_framework.serializers import ModelSerializer
 
 from main.models.order_shipping import OrderShipping
 from main.models.order_shipping_item import OrderShippingItem
+from main.serializers import _OrganizationRelatedField
 
 
 class OrderShippingItemSerializer(ModelSerializer):
@@ -22,11 +22,17 @@ class OrderShippingItemSerializer(ModelSerializer):
         model = OrderShippingItem
 
     id = IntegerField(required=False)
-    order_shipping = PrimaryKeyRelatedField(
-        queryset=OrderShipping.objects.all(), required=True
+    order_shipping = _OrganizationRelatedField(
+        error_messages={
+            "does_not_exist": "Order shipping doesn't belong to the organization."
+        },
+        queryset=OrderShipping.objects.all(),
+        required=True,
     )
 
     def to_internal_value(self, data):
+        if not isinstance(data, dict):
+            return super().to_internal_value(data)
         self.instance = data.pop("instance")
         self.context["quantity"] = data.pop("quantity")
         return super().to_internal_value(data)
@@ -44,10 +50,3 @@ class OrderShippingItemSerializer(ModelSerializer):
                 detail="Order shipping item doesn't belong to the order."
             )
         return value
-
-    def validate_order_shipping(self, value):
-        if value.organization_id != int(self.context["view"].kwargs["organization_id"]):
-            raise ValidationError(
-                detail="Order shipping doesn't belong to the organization."
-            )
-        return value
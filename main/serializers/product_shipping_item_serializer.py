@@ -2,11 +2,11 @@ from decimal import Decimal
 
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import IntegerField
-from rest_framework.relations import PrimaryKeyRelatedField
 from rest_framework.serializers import ModelSerializer
 
 from main.models.product_shipping import ProductShipping
 from main.models.product_shipping_item import ProductShippingItem
+from main.serializers import _OrganizationRelatedField
 
 
 class ProductShippingItemSerializer(ModelSerializer):
@@ -22,19 +22,30 @@ class ProductShippingItemSerializer(ModelSerializer):
         model = ProductShippingItem
 
     id = IntegerField(required=False)
-    product_shipping = PrimaryKeyRelatedField(
-        queryset=ProductShipping.objects.all(), required=True
+    product_shipping = _OrganizationRelatedField(
+        error_messages={
+            "does_not_exist": "Product shipping doesn't belong to the organization."
+        },
+        queryset=ProductShipping.objects.all(),
+        required=True,
     )
 
     def to_internal_value(self, data):
+        if not isinstance(data, dict):
+            return super().to_internal_value(data)
         self.instance = data.pop("instance")
         self.context["quantity"] = data.pop("quantity")
         return super().to_internal_value(data)
 
     def validate(self, data):
-        if Decimal(data["item_total"]) != Decimal(data["fixed_fee"]) + Decimal(
-            data["unit_fee"]
-        ) * int(self.context["quantity"]):
+        try:
+            quantity = int(self.context["quantity"])
+        except (TypeError, ValueError):
+            raise ValidationError(detail="Product item quantity is invalid.")
+        if (
+            Decimal(data["item_total"])
+            != Decimal(data["fixed_fee"]) + Decimal(data["unit_fee"]) * quantity
+        ):
             raise ValidationError(detail="Item total is incorrect.")
         return data
 
@@ -44,10 +55,3 @@ class ProductShippingItemSerializer(ModelSerializer):
                 detail="Product shipping item doesn't belong to the order."
             )
         return value
-
-    def validate_product_shipping(self, value):
-        if value.organization_id != int(self.context["view"].kwargs["organization_id"]):
-            raise ValidationError(
-                detail="Product shipping doesn't belong to the organization."
-            )
-        return value
@@ -1,8 +1,8 @@
-from django.contrib.auth.hashers import make_password
 from rest_framework.fields import CharField
 from rest_framework.serializers import ModelSerializer
 
 from main.models.user import User
+from main.password_hashing import make_password
 from main.shortcuts import set_email_verifying_token
 
 
@@ -1,9 +1,9 @@
-from django.contrib.auth.hashers import make_password
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import CharField
 from rest_framework.serializers import ModelSerializer
 
 from main.models.user import User
+from main.password_hashing import make_password
 from main.shortcuts import delete_password_resetting_token, get_password_resetting_token
 
 
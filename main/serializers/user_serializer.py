@@ -1,10 +1,10 @@
-from django.contrib.auth.hashers import check_password, make_password
 from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import CharField
 from rest_framework.serializers import ModelSerializer
 
 from main.models.user import User
+from main.password_hashing import check_password, make_password
 
 
 class UserSerializer(ModelSerializer):
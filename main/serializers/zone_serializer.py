@@ -0,0 +1,7 @@
+from rest_framework.fields import CharField
+from rest_framework.serializers import Serializer
+
+
+class ZoneSerializer(Serializer):
+    code = CharField(max_length=255)
+    name = CharField(max_length=255)
@@ -1,5 +1,6 @@
 from secrets import token_urlsafe
 
+from django.conf import settings
 from django.core.cache import cache
 from rest_framework.authtoken.models import Token
 
@@ -14,10 +15,18 @@ class ActivityType:
     ALL = (ADMIN, ORGANIZATION, PUBLIC, USER)
 
 
+def delete_activity_state(activity_class, object_id):
+    cache.delete(f"activity_state.{activity_class._get_collection_name()}.{object_id}")
+
+
 def delete_authentication_token(user_id):
     cache.delete(f"authentication_token.{user_id}")
 
 
+def delete_authentication_user(user_id):
+    cache.delete(f"authentication_user.{user_id}")
+
+
 def delete_email_verifying_token(user_id):
     cache.delete(f"email_verifying_token.{user_id}")
 
@@ -26,25 +35,118 @@ def delete_password_resetting_token(user_id):
     cache.delete(f"password_resetting_token.{user_id}")
 
 
+def delete_staff_organization_ids(user_id):
+    cache.delete(f"staff_organization_ids.{user_id}")
+
+
+def delete_staff_organization_ids_many(user_ids):
+    cache.delete_many([f"staff_organization_ids.{user_id}" for user_id in user_ids])
+
+
+def get_activity_state(activity_class, object_id):
+    return cache.get(
+        f"activity_state.{activity_class._get_collection_name()}.{object_id}"
+    )
+
+
 def get_authentication_token(user_id):
     return cache.get(f"authentication_token.{user_id}")
 
 
+def get_authentication_token_and_user(user_id):
+    token_key = f"authentication_token.{user_id}"
+    user_key = f"authentication_user.{user_id}"
+    values = cache.get_many((token_key, user_key))
+    return values.get(token_key), values.get(user_key)
+
+
 def get_email_verifying_token(user_id):
     return cache.get(f"email_verifying_token.{user_id}")
 
 
+def get_order_import(order_import_id):
+    return cache.get(f"order_import.{order_import_id}")
+
+
+def get_pagination_count(organization_id, key):
+    return cache.get(f"pagination_count.{organization_id}.{key}")
+
+
 def get_password_resetting_token(user_id):
     return cache.get(f"password_resetting_token.{user_id}")
 
 
+def get_pricing_version(organization_id):
+    return cache.get(f"pricing_version.{organization_id}")
+
+
+def get_staff_organization_ids(user_id):
+    return cache.get(f"staff_organization_ids.{user_id}")
+
+
+def set_activity_state(activity_class, object_id, state):
+    cache.set(
+        f"activity_state.{activity_class._get_collection_name()}.{object_id}",
+        state,
+        timeout=settings.ACTIVITY_STATE_TIMEOUT,
+    )
+
+
+def set_activity_states(activity_class, states):
+    cache.set_many(
+        {
+            f"activity_state.{activity_class._get_collection_name()}.{object_id}": state
+            for object_id, state in states.items()
+        },
+        timeout=settings.ACTIVITY_STATE_TIMEOUT,
+    )
+
+
 def set_authentication_token(user_id):
     cache.set(f"authentication_token.{user_id}", Token.generate_key())
 
 
+def set_authentication_user(user):
+    cache.set(
+        f"authentication_user.{user.id}",
+        {
+            "email": user.email,
+            "id": user.id,
+            "is_system_administrator": user.is_system_administrator,
+            "name": user.name,
+        },
+    )
+
+
 def set_email_verifying_token(user_id):
     cache.set(f"email_verifying_token.{user_id}", token_urlsafe())
 
 
+def set_order_import(order_import):
+    cache.set(
+        f"order_import.{order_import['id']}",
+        order_import,
+        timeout=settings.ORDER_IMPORT["timeout"],
+    )
+
+
+def set_pagination_count(organization_id, key, count):
+    cache.set(
+        f"pagination_count.{organization_id}.{key}",
+        count,
+        timeout=settings.PAGINATION_COUNT_TIMEOUT,
+    )
+
+
 def set_password_resetting_token(user_id):
     cache.set(f"password_resetting_token.{user_id}", token_urlsafe())
+
+
+def set_pricing_version(organization_id):
+    version = token_urlsafe()
+    cache.set(f"pricing_version.{organization_id}", version, timeout=None)
+    return version
+
+
+def set_staff_organization_ids(user_id, organization_ids):
+    cache.set(f"staff_organization_ids.{user_id}", organization_ids)
@@ -1,3 +1,4 @@
+from main.order_imports import import_orders
 from main.view_sets import send_email
 
-__all__ = ["send_email"]
+__all__ = ["import_orders", "send_email"]
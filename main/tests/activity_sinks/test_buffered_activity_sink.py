@@ -0,0 +1,94 @@
+from time import sleep
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from mongoengine import get_connection
+
+from main.activity_sinks.buffered_activity_sink import BufferedActivitySink
+from main.documents.order_activity import OrderActivity
+from main.documents.product_activity import ProductActivity
+from main.shortcuts import ActivityType
+
+
+class BufferedActivitySinkTestCase(SimpleTestCase):
+    def tearDown(self):
+        super().tearDown()
+        get_connection().drop_database("test")
+
+    def test_flush(self):
+        sink = BufferedActivitySink(flush_interval=60, max_buffer_size=100)
+        for activity_class in (OrderActivity, OrderActivity, ProductActivity):
+            sink.write(activity_class, self._attributes())
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 0)
+        sink.flush()
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 2)
+        self.assertEqual(ProductActivity.partitioned_objects().count(), 1)
+        sink.stop()
+
+    def test_flush__activity_class(self):
+        sink = BufferedActivitySink(flush_interval=60, max_buffer_size=100)
+        for activity_class in (OrderActivity, ProductActivity):
+            sink.write(activity_class, self._attributes())
+        sink.flush(ProductActivity)
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 0)
+        self.assertEqual(ProductActivity.partitioned_objects().count(), 1)
+        self.assertEqual(sink._buffered_count, 1)
+        sink.stop()
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 1)
+
+    def test_flush__failed(self):
+        sink = BufferedActivitySink(flush_interval=60, max_buffer_size=100)
+        sink.write(OrderActivity, self._attributes())
+        with patch.object(OrderActivity, "insert_partitioned", side_effect=OSError):
+            with self.assertLogs("main.activity_sinks.buffered_activity_sink", "ERROR"):
+                sink.flush()
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 0)
+        sink.flush()
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 1)
+        sink.stop()
+
+    def test_flush__partially_written(self):
+        sink = BufferedActivitySink(flush_interval=60, max_buffer_size=100)
+        sink.write(OrderActivity, self._attributes())
+        sink.write(OrderActivity, self._attributes())
+        OrderActivity.insert_partitioned(sink._buffers[OrderActivity][:1])
+        with self.assertNoLogs("main.activity_sinks.buffered_activity_sink"):
+            sink.flush()
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 2)
+        sink.stop()
+
+    def test_stop(self):
+        sink = BufferedActivitySink(flush_interval=60, max_buffer_size=100)
+        sink.write(OrderActivity, self._attributes())
+        sink.stop()
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 1)
+
+    def test_write__buffer_capacity(self):
+        sink = BufferedActivitySink(
+            buffer_capacity=1, flush_interval=60, max_buffer_size=100
+        )
+        sink.write(OrderActivity, self._attributes())
+        sink.write(OrderActivity, self._attributes())
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 1)
+        sink.stop()
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 2)
+
+    def test_write__max_buffer_size(self):
+        sink = BufferedActivitySink(flush_interval=60, max_buffer_size=2)
+        sink.write(OrderActivity, self._attributes())
+        sink.write(OrderActivity, self._attributes())
+        for _ in range(100):
+            if OrderActivity.partitioned_objects().count() == 2:
+                break
+            sleep(0.01)
+        self.assertEqual(OrderActivity.partitioned_objects().count(), 2)
+        sink.stop()
+
+    @staticmethod
+    def _attributes():
+        return {
+            "creator_type": ActivityType.ORGANIZATION,
+            "data": {"code": "code"},
+            "object_id": 1,
+            "organization_id": 1,
+        }
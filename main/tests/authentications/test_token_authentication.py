@@ -1,12 +1,55 @@
+from django.core.cache import cache
 from django.test import TransactionTestCase
 from django.test.client import RequestFactory
 from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import AuthenticationFailed
 
 from main.authentications.token_authentication import BearerAuthentication
+from main.factories.user_factory import UserFactory
+from main.shortcuts import (
+    get_authentication_token,
+    get_authentication_token_and_user,
+    set_authentication_token,
+)
 
 
 class BearerAuthenticationTestCase(TransactionTestCase):
+    def tearDown(self):
+        super().tearDown()
+        cache.clear()
+
+    def test_authenticate(self):
+        user = UserFactory.create()
+        set_authentication_token(user.id)
+        http_authorization = (
+            f"{BearerAuthentication.SCHEME} {user.id}"
+            f" {get_authentication_token(user.id)}"
+        )
+        request = RequestFactory(HTTP_AUTHORIZATION=http_authorization).get(None)
+        self.assertEqual(BearerAuthentication().authenticate(request), (user, None))
+        self.assertIsNotNone(get_authentication_token_and_user(user.id)[1])
+
+    def test_authenticate__user_cached(self):
+        user = UserFactory.create()
+        set_authentication_token(user.id)
+        http_authorization = (
+            f"{BearerAuthentication.SCHEME} {user.id}"
+            f" {get_authentication_token(user.id)}"
+        )
+        request = RequestFactory(HTTP_AUTHORIZATION=http_authorization).get(None)
+        BearerAuthentication().authenticate(request)
+        with self.assertNumQueries(0):
+            cached_user, _ = BearerAuthentication().authenticate(request)
+        self.assertEqual(
+            (
+                cached_user.email,
+                cached_user.id,
+                cached_user.is_system_administrator,
+                cached_user.name,
+            ),
+            (user.email, user.id, user.is_system_administrator, user.name),
+        )
+
     def test_authenticate__scheme_not_match(self):
         request = RequestFactory(
             HTTP_AUTHORIZATION=f"{BearerAuthentication.SCHEME}_"
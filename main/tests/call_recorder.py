@@ -0,0 +1,117 @@
+from collections import Counter
+from contextlib import contextmanager
+from fcntl import LOCK_EX, flock
+from functools import cache
+from json import dumps, loads
+from os import environ
+from pathlib import Path
+
+from pymongo.monitoring import CommandListener
+from redis.client import Pipeline, Redis
+
+CALL_BUDGET_PATH = Path(__file__).resolve().parent / "call_budgets.json"
+CALL_KINDS = ("mongo", "redis", "sql")
+
+
+class MongoCommandListener(CommandListener):
+    def __init__(self):
+        self.counters = []
+
+    def failed(self, event):
+        pass
+
+    def started(self, event):
+        for counter in self.counters:
+            counter["mongo"] += 1
+
+    def succeeded(self, event):
+        pass
+
+
+mongo_command_listener = MongoCommandListener()
+
+
+def assert_call_budget(test_case, name, counts):
+    update_kinds = _get_update_kinds()
+    if update_kinds:
+        _update_call_budget(name, counts, update_kinds)
+        return
+    budget = _get_call_budgets().get(name)
+    test_case.assertIsNotNone(
+        budget,
+        f"{name} has no call budget in {CALL_BUDGET_PATH.name}, record it with"
+        " CALL_BUDGETS_UPDATE=1.",
+    )
+    test_case.assertEqual(
+        {
+            kind: f"{counts[kind]} > {budget[kind]}"
+            for kind in CALL_KINDS
+            if kind in budget and counts[kind] > budget[kind]
+        },
+        {},
+        f"{name} exceeds its call budget in {CALL_BUDGET_PATH.name}.",
+    )
+
+
+@contextmanager
+def record_calls():
+    from django.db import connection
+
+    counter = Counter({kind: 0 for kind in CALL_KINDS})
+
+    def count_sql(execute, sql, params, many, context):
+        counter["sql"] += 1
+        return execute(sql, params, many, context)
+
+    execute_command = Redis.execute_command
+    execute_pipeline = Pipeline.execute
+
+    def count_redis_command(self, *args, **kwargs):
+        counter["redis"] += 1
+        return execute_command(self, *args, **kwargs)
+
+    def count_redis_pipeline(self, *args, **kwargs):
+        counter["redis"] += 1
+        return execute_pipeline(self, *args, **kwargs)
+
+    mongo_command_listener.counters.append(counter)
+    Redis.execute_command = count_redis_command
+    Pipeline.execute = count_redis_pipeline
+    try:
+        with connection.execute_wrapper(count_sql):
+            yield counter
+    finally:
+        Pipeline.execute = execute_pipeline
+        Redis.execute_command = execute_command
+        mongo_command_listener.counters.remove(counter)
+
+
+@cache
+def _get_call_budgets():
+    return loads(CALL_BUDGET_PATH.read_text())
+
+
+def _get_update_kinds():
+    # CALL_BUDGETS_UPDATE=1 records every kind, while a comma-separated list
+    # such as sql,redis records only the backends the run talks to for real.
+    value = environ.get("CALL_BUDGETS_UPDATE", "")
+    if value == "1":
+        return CALL_KINDS
+    return tuple(kind for kind in value.split(",") if kind in CALL_KINDS)
+
+
+def _update_call_budget(name, counts, kinds):
+    # Several test processes may record at once, and an endpoint keeps the
+    # highest counts of all its requests.
+    with CALL_BUDGET_PATH.open("a+") as file:
+        flock(file, LOCK_EX)
+        file.seek(0)
+        budgets = loads(file.read() or "{}")
+        budget = budgets.get(name, {})
+        budgets[name] = {
+            **budget,
+            **{kind: max(counts[kind], budget.get(kind, 0)) for kind in kinds},
+        }
+        file.seek(0)
+        file.truncate()
+        file.write(f"{dumps(budgets, indent=2, sort_keys=True)}\n")
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+from django.http import QueryDict
+from django.test import SimpleTestCase
+from rest_framework.fields import DecimalField, IntegerField, ListField
+from rest_framework.serializers import Serializer
+
+from main.filter_backends.filter_backend import FilterBackend
+from main.models.order import Order
+
+
+class _OrderFilterSet(Serializer):
+    productitem__in = ListField(child=IntegerField())
+    productitem__product__in = ListField(child=IntegerField())
+    productitem__productshippingitem__product_shipping__in = ListField(
+        child=IntegerField()
+    )
+    total__gte = DecimalField(decimal_places=4, max_digits=19)
+
+
+class FilterBackendTestCase(SimpleTestCase):
+    def test_filter_queryset__column(self):
+        sql = self._filter_queryset("total__gte=1")
+        self.assertNotIn("DISTINCT", sql)
+        self.assertNotIn("EXISTS", sql)
+
+    def test_filter_queryset__multi_valued_relation(self):
+        sql = self._filter_queryset(
+            "productitem__product__in=1&productitem__product__in=2"
+            "&productitem__productshippingitem__product_shipping__in=3"
+            "&total__gte=1"
+        )
+        self.assertNotIn("DISTINCT", sql)
+        self.assertEqual(sql.count("EXISTS"), 1)
+        self.assertNotIn('FROM "main_order" INNER JOIN', sql)
+
+    def test_filter_queryset__multi_valued_relation__lookup(self):
+        sql = self._filter_queryset("productitem__in=1&productitem__in=2")
+        self.assertEqual(sql.count("EXISTS"), 1)
+        self.assertIn('U0."id" IN (1, 2)', sql)
+
+    @staticmethod
+    def _filter_queryset(query_string):
+        return str(
+            FilterBackend()
+            .filter_queryset(
+                SimpleNamespace(query_params=QueryDict(query_string)),
+                Order.objects.all(),
+                SimpleNamespace(filter_set_class=_OrderFilterSet),
+            )
+            .query
+        )
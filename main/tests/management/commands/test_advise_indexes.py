@@ -0,0 +1,26 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+
+class AdviseIndexesTestCase(TestCase):
+    def test_handle(self):
+        stdout = StringIO()
+        call_command("advise_indexes", stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+        self.assertIn("  (email, id): covered by main_user_email_key scans=0", lines)
+        self.assertIn(
+            "  (organization_id, code, id): proposed main_order_organiz_c9aa34_idx",
+            lines,
+        )
+        self.assertIn(
+            "  (organization_id, created_at, id): proposed"
+            " main_order_organiz_68da76_idx",
+            lines,
+        )
+
+    def test_handle__check(self):
+        with self.assertRaises(CommandError):
+            call_command("advise_indexes", check=True, stdout=StringIO())
@@ -0,0 +1,62 @@
+from datetime import datetime
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from bson import ObjectId
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from mongoengine import get_connection
+
+from main.documents.order_activity import OrderActivity
+from main.shortcuts import ActivityType
+
+
+class ArchiveActivitiesTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+        get_connection().drop_database("test")
+
+    def test_handle(self):
+        old_activity = self._create_activity(datetime(2000, 1, 1))
+        new_activity = self._create_activity(datetime.utcnow())
+        call_command(
+            "archive_activities",
+            directory=self.directory.name,
+            kept_months=1,
+            stdout=StringIO(),
+        )
+        self.assertEqual(
+            OrderActivity.get_partition_names(),
+            [OrderActivity.get_partition_name(new_activity.id)],
+        )
+        call_command(
+            "restore_activities",
+            OrderActivity.get_partition_name(old_activity.id),
+            directory=self.directory.name,
+            stdout=StringIO(),
+        )
+        self.assertEqual(
+            [activity.id for activity in OrderActivity.partitioned_objects()],
+            [new_activity.id, old_activity.id],
+        )
+        self.assertEqual(
+            OrderActivity.partitioned_objects(id__lt=new_activity.id).first().data,
+            old_activity.data,
+        )
+
+    @staticmethod
+    def _create_activity(created_at):
+        activity = OrderActivity(
+            creator_type=ActivityType.ORGANIZATION,
+            data={"created_at": str(created_at)},
+            id=ObjectId.from_datetime(created_at),
+            object_id=0,
+            organization_id=0,
+        )
+        OrderActivity.insert_partitioned((activity,))
+        return activity
@@ -0,0 +1,45 @@
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from main.order_imports import OrderImportStatus
+from main.shortcuts import set_order_import
+
+
+class DeleteOrderImportFilesTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+        cache.clear()
+
+    def test_handle(self):
+        directory = Path(self.directory.name)
+        for order_import_id, status in (
+            ("failed", OrderImportStatus.FAILED),
+            ("running", OrderImportStatus.RUNNING),
+            ("succeeded", OrderImportStatus.SUCCEEDED),
+        ):
+            set_order_import({
+                "id": order_import_id,
+                "status": status,
+                "updated_at": datetime.utcnow(),
+            })
+            (directory / order_import_id).touch()
+        (directory / "expired").touch()
+        with override_settings(
+            ORDER_IMPORT={**settings.ORDER_IMPORT, "directory": directory}
+        ):
+            call_command("delete_order_import_files", stdout=StringIO())
+        self.assertCountEqual(
+            [path.name for path in directory.iterdir()], ["failed", "running"]
+        )
@@ -0,0 +1,23 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+from mongoengine import get_connection
+
+
+class EnsureActivityIndexesTestCase(SimpleTestCase):
+    def tearDown(self):
+        super().tearDown()
+        get_connection().drop_database("test")
+
+    def test_handle(self):
+        call_command("ensure_activity_indexes", stdout=StringIO())
+        stdout = StringIO()
+        call_command("ensure_activity_indexes", check=True, stdout=stdout)
+        self.assertIn("object_id_1__id_-1", stdout.getvalue())
+        self.assertIn("collection_1_object_id_1_activity_id_-1", stdout.getvalue())
+
+    def test_handle__check_missing(self):
+        with self.assertRaises(CommandError):
+            call_command("ensure_activity_indexes", check=True, stdout=StringIO())
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import TransactionTestCase
+
+from main.factories.staff_factory import StaffFactory
+from main.permissions.organization_permission import OrganizationPermission
+from main.shortcuts import delete_staff_organization_ids
+
+
+class OrganizationPermissionTestCase(TransactionTestCase):
+    def tearDown(self):
+        super().tearDown()
+        cache.clear()
+
+    def test_has_permission(self):
+        staff = StaffFactory.create(does_organization_agree=True, does_user_agree=True)
+        self.assertTrue(self._has_permission(staff))
+
+    def test_has_permission__not_agreed(self):
+        staff = StaffFactory.create(does_organization_agree=True, does_user_agree=False)
+        self.assertFalse(self._has_permission(staff))
+
+    def test_has_permission__cached(self):
+        staff = StaffFactory.create(does_organization_agree=True, does_user_agree=True)
+        self._has_permission(staff)
+        with self.assertNumQueries(0):
+            self.assertTrue(self._has_permission(staff))
+
+    def test_has_permission__invalidated(self):
+        staff = StaffFactory.create(does_organization_agree=True, does_user_agree=False)
+        self._has_permission(staff)
+        staff.does_user_agree = True
+        staff.save()
+        delete_staff_organization_ids(staff.user_id)
+        self.assertTrue(self._has_permission(staff))
+
+    @staticmethod
+    def _has_permission(staff):
+        request = SimpleNamespace(user=staff.user)
+        view = SimpleNamespace(kwargs={"organization_id": str(staff.organization_id)})
+        return OrganizationPermission().has_permission(request, view)
@@ -0,0 +1,105 @@
+from django.db.models import Prefetch
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from main.factories.order_with_related_factory import OrderWithRelatedFactory
+from main.factories.organization_factory import OrganizationFactory
+from main.models.order import Order
+from main.models.order_shipping_item import OrderShippingItem
+from main.models.product_item import ProductItem
+from main.models.product_shipping_item import ProductShippingItem
+from main.serializers.order_fast_serializer import OrderFastSerializer
+from main.serializers.order_serializer import OrderSerializer
+
+
+class OrderFastSerializerTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        organization = OrganizationFactory.create()
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": organization},
+            order_shipping_item_count=2,
+            order_shipping_kwargs={"organization": organization},
+            product_item_count=2,
+            product_kwargs={"organization": organization},
+            product_shipping_item_count=2,
+            product_shipping_kwargs={"organization": organization},
+        ).create_batch(3)
+        OrderWithRelatedFactory(order_kwargs={"organization": organization}).create()
+        order = OrderWithRelatedFactory(
+            order_kwargs={"organization": organization},
+            order_shipping_item_count=1,
+            order_shipping_kwargs={"organization": organization},
+            product_item_count=1,
+            product_kwargs={"organization": organization},
+            product_shipping_item_count=1,
+            product_shipping_kwargs={"organization": organization},
+        ).create()
+        order.ordershippingitem_set.update(order_shipping=None)
+        ProductItem.objects.filter(order=order).update(product=None)
+        ProductShippingItem.objects.filter(product_item__order=order).update(
+            product_shipping=None
+        )
+
+    def test_data(self):
+        self.assertEqual(
+            self._render(OrderFastSerializer(self._get_values_list(), many=True)),
+            self._render(OrderSerializer(self._get_orders(), many=True)),
+        )
+
+    def test_data__field_names(self):
+        field_names = frozenset(("code", "productitem_set", "total"))
+        serializer = OrderSerializer(self._get_orders(), many=True)
+        for name in set(serializer.child.fields) - field_names:
+            serializer.child.fields.pop(name)
+        self.assertEqual(
+            self._render(
+                OrderFastSerializer(
+                    self._get_values_list(field_names),
+                    field_names=field_names,
+                    many=True,
+                )
+            ),
+            self._render(serializer),
+        )
+
+    def test_data__single(self):
+        order = self._get_orders()[0]
+        self.assertEqual(
+            self._render(OrderFastSerializer(self._get_values_list()[0])),
+            self._render(OrderSerializer(order)),
+        )
+
+    def test_data__statement_count(self):
+        with self.assertNumQueries(4):
+            OrderFastSerializer(self._get_values_list(), many=True).data
+
+    @staticmethod
+    def _get_orders():
+        return list(
+            Order.objects.prefetch_related(
+                Prefetch(
+                    "ordershippingitem_set",
+                    queryset=OrderShippingItem.objects.order_by("id"),
+                ),
+                Prefetch(
+                    "productitem_set", queryset=ProductItem.objects.order_by("id")
+                ),
+                Prefetch(
+                    "productitem_set__productshippingitem_set",
+                    queryset=ProductShippingItem.objects.order_by("id"),
+                ),
+            ).order_by("id")
+        )
+
+    @staticmethod
+    def _get_values_list(field_names=None):
+        return list(
+            Order.objects.order_by("id").values_list(
+                *OrderFastSerializer.get_columns(field_names)
+            )
+        )
+
+    @staticmethod
+    def _render(serializer):
+        return JSONRenderer().render(serializer.data)
@@ -0,0 +1,29 @@
+from django.test import SimpleTestCase, override_settings
+
+from main import password_hashing
+from main.password_hashing import (
+    PasswordHashingUnavailable,
+    check_password,
+    make_password,
+)
+
+
+class PasswordHashingTestCase(SimpleTestCase):
+    def test_check_password(self):
+        encoded = make_password("password")
+        self.assertTrue(check_password("password", encoded))
+        self.assertFalse(check_password("password_", encoded))
+
+    def test_make_password__broken_pool(self):
+        make_password("password")
+        for process in list(password_hashing._executor._processes.values()):
+            process.kill()
+            process.join()
+        with self.assertRaises(PasswordHashingUnavailable):
+            make_password("password")
+        self.assertTrue(check_password("password", make_password("password")))
+
+    @override_settings(PASSWORD_HASHING={"max_pending": 0, "max_workers": 1})
+    def test_make_password__saturated(self):
+        with self.assertRaises(PasswordHashingUnavailable):
+            make_password("password")
@@ -0,0 +1,16 @@
+from rest_framework.reverse import reverse
+from rest_framework.status import HTTP_200_OK
+
+from main.metrics import counters, gauges
+from main.tests.view_sets.admin_test_case import AdminTestCase
+from main.view_sets.admin_metric_view_set import AdminMetricViewSet
+
+
+class AdminMetricViewSetTestCase(AdminTestCase):
+    basename = "admin-metric"
+    view_set = AdminMetricViewSet
+
+    def test_list(self):
+        response = self._request("get", reverse("admin-metric-list"))
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.json(), {**counters, **gauges})
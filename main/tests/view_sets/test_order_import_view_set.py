@@ -0,0 +1,104 @@
+from json import dumps
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
+
+from main.factories.order_with_related_factory import OrderWithRelatedFactory
+from main.models.order import Order
+from main.order_imports import OrderImportFormat, OrderImportStatus
+from main.tests.view_sets.organization_test_case import OrganizationTestCase
+from main.view_sets.order_import_view_set import OrderImportViewSet
+
+
+class OrderImportViewSetTestCase(OrganizationTestCase):
+    basename = "order-import"
+    view_set = OrderImportViewSet
+
+    def setUp(self):
+        super().setUp()
+        self.directory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def test_create(self):
+        data_list = [
+            OrderWithRelatedFactory(
+                order_kwargs={"organization": self.organization},
+                order_shipping_item_count=1,
+                order_shipping_kwargs={"organization": self.organization},
+                product_item_count=2,
+                product_kwargs={"organization": self.organization},
+                product_shipping_item_count=1,
+                product_shipping_kwargs={"organization": self.organization},
+            ).get_deserializer_data()
+            for _ in range(2)
+        ]
+        lines = [
+            dumps(data)
+            for data in (
+                *data_list,
+                data_list[0],
+                {**data_list[0], "code": "code", "productitem_set": "items"},
+            )
+        ]
+        lines.insert(1, "{")
+        with override_settings(
+            ORDER_IMPORT={
+                **settings.ORDER_IMPORT,
+                "chunk_size": 2,
+                "directory": Path(self.directory.name),
+            },
+            task_always_eager=True,
+        ):
+            response = self._request(
+                "post",
+                self._list_path(),
+                {
+                    "file": SimpleUploadedFile(
+                        "orders.ndjson", "\n".join(lines).encode()
+                    ),
+                    "format": OrderImportFormat.NDJSON,
+                },
+                format="multipart",
+            )
+            self.assertEqual(response.status_code, HTTP_201_CREATED)
+            response = self._request("get", self._detail_path(response.json()["id"]))
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        order_import = response.json()
+        self.assertEqual(order_import["created_count"], 2)
+        self.assertEqual(order_import["error_count"], 3)
+        self.assertEqual(
+            order_import["errors"],
+            [
+                {"errors": {"non_field_errors": ["Row is malformed."]}, "row": 2},
+                {"errors": {"code": ["Code is already in another order."]}, "row": 4},
+                {
+                    "errors": {
+                        "ordershippingitem_set": [
+                            {"non_field_errors": ["Item total is incorrect."]}
+                        ],
+                        "productitem_set": {
+                            "non_field_errors": [
+                                'Expected a list of items but got type "str".'
+                            ]
+                        },
+                    },
+                    "row": 5,
+                },
+            ],
+        )
+        self.assertEqual(order_import["processed_row_count"], 5)
+        self.assertEqual(order_import["status"], OrderImportStatus.SUCCEEDED)
+        self.assertEqual(list(Path(self.directory.name).iterdir()), [])
+        self.assertCountEqual(
+            Order.objects.filter(organization=self.organization).values_list(
+                "code", flat=True
+            ),
+            [data["code"] for data in data_list],
+        )
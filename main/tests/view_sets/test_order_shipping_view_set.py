@@ -3,10 +3,10 @@ from random import sample
 from factory import Iterator
 
 from main.factories.order_shipping_factory import OrderShippingFactory
-from main.models import ZONE_CHOICES
 from main.models.order_shipping import OrderShipping
 from main.tests.view_sets.organization_test_case import OrganizationTestCase
 from main.view_sets.order_shipping_view_set import OrderShippingViewSet
+from main.zones import get_zone_codes
 
 
 class OrderShippingViewSetTestCase(OrganizationTestCase):
@@ -24,6 +24,12 @@ class OrderShippingViewSetTestCase(OrganizationTestCase):
             data, {"code": ["Code is already in another order shipping."]}
         )
 
+    def test_create__zones__invalid(self):
+        data = {**self._get_deserializer_data(), "zones": ["JP", "XX-00"]}
+        self._act_and_assert_create_validation_test(
+            data, {"zones": ["XX-00 isn't a valid zone."]}
+        )
+
     def test_destroy(self):
         self._act_and_assert_destroy_test(
             OrderShippingFactory.create(organization=self.organization)
@@ -88,7 +94,7 @@ class OrderShippingViewSetTestCase(OrganizationTestCase):
         })
 
     def test_list__filter__zones__overlap(self):
-        zones = sample([choice[0] for choice in ZONE_CHOICES], 6)
+        zones = sample(sorted(get_zone_codes()), 6)
         OrderShippingFactory.create(organization=self.organization, zones=zones[0:2])
         order_shipping_list = OrderShippingFactory.create_batch(
             2,
@@ -127,7 +133,7 @@ class OrderShippingViewSetTestCase(OrganizationTestCase):
         )
 
     def test_update(self):
-        zones = sample([choice[0] for choice in ZONE_CHOICES], 3)
+        zones = sample(sorted(get_zone_codes()), 3)
         order_shipping = OrderShippingFactory.create(
             organization=self.organization,
             zones=zones[1:3],
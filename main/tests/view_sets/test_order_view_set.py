@@ -1,13 +1,29 @@
 from decimal import Decimal
+from unittest.mock import patch
 
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.reverse import reverse
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+)
+
+from main import order_quotes
 from main.factories.order_shipping_factory import OrderShippingFactory
 from main.factories.order_with_related_factory import OrderWithRelatedFactory
+from main.factories.organization_factory import OrganizationFactory
 from main.factories.product_factory import ProductFactory
 from main.factories.product_shipping_factory import ProductShippingFactory
 from main.models.order import Order
 from main.models.order_shipping_item import OrderShippingItem
 from main.models.product_item import ProductItem
 from main.models.product_shipping_item import ProductShippingItem
+from main.order_quotes import get_pricing_tables
+from main.serializers.order_serializer import OrderSerializer
 from main.tests.view_sets.organization_test_case import OrganizationTestCase
 from main.view_sets.order_view_set import OrderViewSet
 
@@ -170,6 +186,114 @@ class OrderViewSetTestCase(OrganizationTestCase):
 
 
 class OrderNonValidationTestCase(OrderViewSetTestCase):
+    def test_batch(self):
+        data_list = [
+            self._get_order_with_related_factory(1).get_deserializer_data()
+            for _ in range(2)
+        ]
+        data_list.append({**data_list[0]})
+        response = self._request(
+            "post",
+            reverse("order-batch", kwargs={"organization_id": self.organization.id}),
+            data_list,
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(
+            [result["status"] for result in results],
+            [HTTP_201_CREATED, HTTP_201_CREATED, HTTP_400_BAD_REQUEST],
+        )
+        self.assertEqual(
+            results[2]["errors"], {"code": ["Code is already in another order."]}
+        )
+        for data, result in zip(data_list[:2], results):
+            self._assert_and_get_saved_object(
+                data, {**data, "id": result["data"]["id"]}
+            )
+        self.assertEqual(
+            self.view_set.activity_class.partitioned_objects(
+                organization_id=self.organization.id
+            ).count(),
+            2,
+        )
+
+    def test_batch__call_scaling(self):
+        self._act_and_assert_call_scaling(
+            lambda size: (
+                "post",
+                reverse(
+                    "order-batch", kwargs={"organization_id": self.organization.id}
+                ),
+                [
+                    self._get_order_with_related_factory(1).get_deserializer_data()
+                    for _ in range(size)
+                ],
+            )
+        )
+
+    def test_batch__code_taken_concurrently(self):
+        data_list = [
+            self._get_order_with_related_factory(1).get_deserializer_data()
+            for _ in range(2)
+        ]
+        order = self._get_order_with_related_factory(1).create()
+        data_list[1]["code"] = order.code
+        with patch.object(OrderSerializer, "get_existing_codes", return_value=set()):
+            response = self._request(
+                "post",
+                reverse(
+                    "order-batch", kwargs={"organization_id": self.organization.id}
+                ),
+                data_list,
+            )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(
+            [result["status"] for result in results],
+            [HTTP_201_CREATED, HTTP_400_BAD_REQUEST],
+        )
+        self.assertEqual(
+            results[1]["errors"], {"code": ["Code is already in another order."]}
+        )
+        self._assert_and_get_saved_object(
+            data_list[0], {**data_list[0], "id": results[0]["data"]["id"]}
+        )
+        self.assertEqual(
+            self.view_set.activity_class.partitioned_objects(
+                organization_id=self.organization.id
+            ).count(),
+            1,
+        )
+
+    def test_batch__malformed_items(self):
+        data = self._get_order_with_related_factory(1).get_deserializer_data()
+        product_item_data = data["productitem_set"][0]
+        data_list = [
+            {**data, "ordershippingitem_set": 1, "productitem_set": "items"},
+            {**data, "ordershippingitem_set": [1], "productitem_set": ["item"]},
+            {
+                **data,
+                "productitem_set": [
+                    {
+                        **product_item_data,
+                        "productshippingitem_set": {},
+                        "quantity": "many",
+                    }
+                ],
+            },
+        ]
+        response = self._request(
+            "post",
+            reverse("order-batch", kwargs={"organization_id": self.organization.id}),
+            data_list,
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            [result["status"] for result in response.json()],
+            [HTTP_400_BAD_REQUEST] * 3,
+        )
+        self.assertFalse(Order.objects.filter(organization=self.organization).exists())
+
     def test_create(self):
         data = OrderWithRelatedFactory(
             order_kwargs={"organization": self.organization},
@@ -182,6 +306,51 @@ class OrderNonValidationTestCase(OrderViewSetTestCase):
         ).get_deserializer_data()
         self._act_and_assert_create_test(data, {**data})
 
+    def test_create__call_scaling(self):
+        self._act_and_assert_call_scaling(
+            lambda size: (
+                "post",
+                self._list_path(),
+                self._get_order_with_related_factory(size).get_deserializer_data(),
+            )
+        )
+
+    def test_create__write_statement_count(self):
+        write_statement_counts = [
+            self._count_write_statements(
+                "post",
+                reverse("order-list", kwargs={"organization_id": self.organization.id}),
+                self._get_order_with_related_factory(
+                    item_count
+                ).get_deserializer_data(),
+                HTTP_201_CREATED,
+            )
+            for item_count in (1, 10)
+        ]
+        self.assertEqual(write_statement_counts[0], write_statement_counts[1])
+
+    def test_create__related_object_statement_count(self):
+        statement_counts = [
+            self._count_statements(
+                "post",
+                reverse("order-list", kwargs={"organization_id": self.organization.id}),
+                self._get_order_with_related_factory(
+                    item_count
+                ).get_deserializer_data(),
+                HTTP_201_CREATED,
+                tuple(
+                    f'SELECT "{table}".'
+                    for table in (
+                        "main_ordershipping",
+                        "main_product",
+                        "main_productshipping",
+                    )
+                ),
+            )
+            for item_count in (1, 10)
+        ]
+        self.assertEqual(statement_counts, [3, 3])
+
     def test_destroy(self):
         order = OrderWithRelatedFactory(
             order_kwargs={"organization": self.organization},
@@ -194,6 +363,47 @@ class OrderNonValidationTestCase(OrderViewSetTestCase):
         ).create()
         self._act_and_assert_destroy_test(order)
 
+    def test_list__expand(self):
+        order = OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+            product_item_count=2,
+            product_kwargs={"organization": self.organization},
+        ).create()
+        response = self._request(
+            "get", self._list_path(), {"expand": "productitem_set", "fields": "code"}
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        expected = self._get_serializer_data(order)
+        self.assertEqual(
+            response.json()["results"],
+            [{"code": order.code, "productitem_set": expected["productitem_set"]}],
+        )
+
+    def test_list__fields(self):
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create_batch(2)
+        orders = Order.objects.filter(organization=self.organization)
+        response = self._request("get", self._list_path(), {"fields": "code,total"})
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertCountEqual(
+            response.json()["results"],
+            [{"code": order.code, "total": str(order.total)} for order in orders],
+        )
+
+    def test_list__fields__invalid(self):
+        response = self._request(
+            "get", self._list_path(), {"expand": "code", "fields": "productitem_set"}
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {
+                "expand": "Invalid expand: code.",
+                "fields": "Invalid fields: productitem_set.",
+            },
+        )
+
     def test_list__filter__code__icontains(self):
         OrderWithRelatedFactory(
             order_kwargs={"organization": self.organization},
@@ -386,6 +596,88 @@ class OrderNonValidationTestCase(OrderViewSetTestCase):
         ).create_batch(4)
         self._act_and_assert_list_test({"limit": 2, "offset": 1, "ordering": "id"})
 
+    def test_list__paginate__default(self):
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create_batch(3)
+        response = self._request("get", self._list_path(), {"limit": 2})
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(set(response.json()), {"count", "next", "previous", "results"})
+        self.assertEqual(response.json()["count"], 3)
+        self.assertIn("offset=2", response.json()["next"])
+
+    def test_list__paginate__count__cached(self):
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create_batch(2)
+        request_query = {"count": "cached", "limit": 1, "offset": 0}
+        response = self._request("get", self._list_path(), request_query)
+        self.assertEqual(response.json()["count"], 2)
+        self.assertIsNotNone(response.json()["next"])
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create()
+        response = self._request("get", self._list_path(), request_query)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_list__paginate__count__exact(self):
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create_batch(2)
+        request_query = {"limit": 1, "offset": 0}
+        response = self._request("get", self._list_path(), request_query)
+        self.assertEqual(response.json()["count"], 2)
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create()
+        response = self._request("get", self._list_path(), request_query)
+        self.assertEqual(response.json()["count"], 3)
+
+    def test_list__paginate__count__estimate(self):
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create_batch(3)
+        response = self._request(
+            "get",
+            self._list_path(),
+            {"count": "estimate", "limit": 2, "offset": 0, "ordering": "id"},
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertIsInstance(response.json()["count"], int)
+        self.assertIsNotNone(response.json()["next"])
+
+    def test_list__paginate__count__none(self):
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create_batch(3)
+        request_query = {"count": "none", "limit": 2, "offset": 1, "ordering": "id"}
+        response = self._request("get", self._list_path(), request_query)
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertIsNone(response.json()["count"])
+        self.assertIsNone(response.json()["next"])
+        self.assertEqual(
+            response.json()["results"],
+            self._expected_data_list({"limit": 2, "offset": 1, "ordering": "id"}),
+        )
+
+    def test_list__paginate__cursor(self):
+        OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+        ).create_batch(5)
+        results = []
+        path = f"{self._list_path()}?cursor=&limit=2&ordering=-code"
+        while path is not None:
+            response = self._request("get", path)
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertNotIn("count", response.json())
+            results += response.json()["results"]
+            path = response.json()["next"]
+        self.assertEqual(results, self._expected_data_list({"ordering": "-code"}))
+
+    def test_list__paginate__cursor__invalid(self):
+        response = self._request("get", self._list_path(), {"cursor": "invalid"})
+        self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
+
     def test_list__sort__code(self):
         OrderWithRelatedFactory(
             order_kwargs={"organization": self.organization},
@@ -438,6 +730,120 @@ class OrderNonValidationTestCase(OrderViewSetTestCase):
         ).create_batch(2)
         self._act_and_assert_list_test({"ordering": "total"})
 
+    def test_quoting(self):
+        product = ProductFactory.create(organization=self.organization, price="2.5")
+        product_shipping = ProductShippingFactory.create(
+            fixed_fee="1",
+            organization=self.organization,
+            unit_fee="0.5",
+            zones=["JP"],
+        )
+        product_shipping.products.add(product)
+        ProductShippingFactory.create(
+            organization=self.organization, zones=["US"]
+        ).products.add(product)
+        order_shipping = OrderShippingFactory.create(
+            fixed_fee="3",
+            organization=self.organization,
+            unit_fee="0.25",
+            zones=["ALL"],
+        )
+        path = reverse(
+            "order-quoting", kwargs={"organization_id": self.organization.id}
+        )
+        data = {"items": [{"product": product.id, "quantity": 2}], "zone": "JP-13"}
+        self._request("post", path, data)
+        with CaptureQueriesContext(connection) as context:
+            response = self._request("post", path, data)
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(
+            response.json(),
+            {
+                "order_shipping_total": "3.2500",
+                "ordershippingitem_set": [
+                    {
+                        "fixed_fee": "3.0000",
+                        "item_total": "3.2500",
+                        "name": order_shipping.name,
+                        "order_shipping": order_shipping.id,
+                        "unit_fee": "0.2500",
+                    }
+                ],
+                "product_shipping_total": "2.0000",
+                "product_total": "5.0000",
+                "productitem_set": [
+                    {
+                        "item_total": "5.0000",
+                        "name": product.name,
+                        "price": "2.5000",
+                        "product": product.id,
+                        "productshippingitem_set": [
+                            {
+                                "fixed_fee": "1.0000",
+                                "item_total": "2.0000",
+                                "name": product_shipping.name,
+                                "product_shipping": product_shipping.id,
+                                "unit_fee": "0.5000",
+                            }
+                        ],
+                        "quantity": 2,
+                    }
+                ],
+                "total": "10.2500",
+            },
+        )
+
+    @override_settings(PRICING_TABLES_MAX_SIZE=1)
+    def test_quoting__evicted_pricing_tables(self):
+        organization = OrganizationFactory.create()
+        get_pricing_tables(organization.id)
+        get_pricing_tables(self.organization.id)
+        self.assertEqual(list(order_quotes._pricing_tables), [self.organization.id])
+
+    def test_quoting__overlapping_zones(self):
+        product = ProductFactory.create(organization=self.organization)
+        product_shippings = [
+            ProductShippingFactory.create(organization=self.organization, zones=zones)
+            for zones in (["JP"], ["JP-13"])
+        ]
+        for product_shipping in product_shippings:
+            product_shipping.products.add(product)
+        order_shippings = [
+            OrderShippingFactory.create(organization=self.organization, zones=zones)
+            for zones in (["ALL"], ["JP"])
+        ]
+        path = reverse(
+            "order-quoting", kwargs={"organization_id": self.organization.id}
+        )
+        for zone, order_shipping, product_shipping_ids in (
+            ("JP-13", order_shippings[1], [product_shippings[1].id]),
+            ("JP-01", order_shippings[1], [product_shippings[0].id]),
+            ("US", order_shippings[0], []),
+        ):
+            response = self._request(
+                "post",
+                path,
+                {"items": [{"product": product.id, "quantity": 1}], "zone": zone},
+            )
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertEqual(
+                [
+                    data["order_shipping"]
+                    for data in response.json()["ordershippingitem_set"]
+                ],
+                [order_shipping.id],
+            )
+            self.assertEqual(
+                [
+                    data["product_shipping"]
+                    for data in response.json()["productitem_set"][0][
+                        "productshippingitem_set"
+                    ]
+                ],
+                product_shipping_ids,
+            )
+
     def test_retrieve(self):
         self._act_and_assert_retrieve_test(
             OrderWithRelatedFactory(
@@ -482,6 +888,89 @@ class OrderNonValidationTestCase(OrderViewSetTestCase):
         filter_ = {**data, "organization_id": self.organization.id}
         self._act_and_assert_update_test(data, filter_, order.id)
 
+    def test_retrieve__call_scaling(self):
+        self._act_and_assert_call_scaling(
+            lambda size: (
+                "get",
+                self._detail_path(
+                    self._get_order_with_related_factory(size).create().id
+                ),
+                None,
+            )
+        )
+
+    def test_update__call_scaling(self):
+        def prepare(size):
+            order = self._get_order_with_related_factory(size).create()
+            data = self._get_order_with_related_factory(size).get_deserializer_data()
+            for product_item, product_item_data in zip(
+                order.cached_product_items, data["productitem_set"]
+            ):
+                product_item_data["id"] = product_item.id
+            return "put", self._detail_path(order.id), data
+
+        self._act_and_assert_call_scaling(prepare)
+
+    def test_update__write_statement_count(self):
+        write_statement_counts = []
+        for item_count in (1, 10):
+            order = self._get_order_with_related_factory(item_count).create()
+            data = self._get_order_with_related_factory(
+                item_count
+            ).get_deserializer_data()
+            for order_shipping_item, order_shipping_item_data in zip(
+                order.cached_order_shipping_items, data["ordershippingitem_set"][1:]
+            ):
+                order_shipping_item_data["id"] = order_shipping_item.id
+            for product_item, product_item_data in zip(
+                order.cached_product_items, data["productitem_set"][1:]
+            ):
+                product_item_data["id"] = product_item.id
+                for product_shipping_item, product_shipping_item_data in zip(
+                    product_item.cached_product_shipping_items,
+                    product_item_data["productshippingitem_set"][1:],
+                ):
+                    product_shipping_item_data["id"] = product_shipping_item.id
+            write_statement_counts.append(
+                self._count_write_statements(
+                    "put",
+                    reverse(
+                        "order-detail",
+                        kwargs={
+                            "organization_id": self.organization.id,
+                            "pk": order.id,
+                        },
+                    ),
+                    data,
+                    HTTP_200_OK,
+                )
+            )
+        self.assertEqual(write_statement_counts[0], write_statement_counts[1])
+
+    def _count_statements(self, method, path, data, status_code, prefixes):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(path, data, format="json")
+        self.assertEqual(response.status_code, status_code)
+        return sum(
+            query["sql"].startswith(prefixes) for query in context.captured_queries
+        )
+
+    def _count_write_statements(self, method, path, data, status_code):
+        return self._count_statements(
+            method, path, data, status_code, ("DELETE", "INSERT", "UPDATE")
+        )
+
+    def _get_order_with_related_factory(self, item_count):
+        return OrderWithRelatedFactory(
+            order_kwargs={"organization": self.organization},
+            order_shipping_item_count=item_count + 1,
+            order_shipping_kwargs={"organization": self.organization},
+            product_item_count=item_count + 1,
+            product_kwargs={"organization": self.organization},
+            product_shipping_item_count=2,
+            product_shipping_kwargs={"organization": self.organization},
+        )
+
 
 class OrderShippingItemValidationTestCase(OrderViewSetTestCase):
     def test_create__item_total_incorrect(self):
@@ -0,0 +1,92 @@
+from rest_framework.status import HTTP_200_OK
+
+from main.documents.order_activity import OrderActivity
+from main.documents.organization_activity import OrganizationActivity
+from main.documents.product_activity import ProductActivity
+from main.shortcuts import ActivityType
+from main.tests.view_sets.organization_test_case import OrganizationTestCase
+from main.view_sets.organization_activity_view_set import OrganizationActivityViewSet
+
+
+class OrganizationActivityViewSetTestCase(OrganizationTestCase):
+    basename = "organization-activity"
+    view_set = OrganizationActivityViewSet
+
+    def test_list(self):
+        activities = [
+            self._create_activity(
+                OrganizationActivity,
+                creator_type=ActivityType.ADMIN,
+                object_id=self.organization.id,
+            ),
+            self._create_activity(
+                ProductActivity,
+                creator_type=ActivityType.ORGANIZATION,
+                object_id=0,
+                organization_id=self.organization.id,
+            ),
+            self._create_activity(
+                OrderActivity,
+                creator_type=ActivityType.ORGANIZATION,
+                object_id=0,
+                organization_id=self.organization.id,
+            ),
+        ]
+        self._create_activity(
+            OrderActivity,
+            creator_type=ActivityType.ORGANIZATION,
+            object_id=0,
+            organization_id=self.organization.id + 1,
+        )
+        response = self._request("get", self._list_path(), {"limit": 2})
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [self._get_serializer_data(activity) for activity in activities[:0:-1]],
+        )
+        response = self._request("get", response.json()["next"])
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {"next": None, "results": [self._get_serializer_data(activities[0])]},
+        )
+
+    def test_list__filter__creator_type(self):
+        activity = self._create_activity(
+            ProductActivity,
+            creator_type=ActivityType.ORGANIZATION,
+            object_id=0,
+            organization_id=self.organization.id,
+        )
+        self._create_activity(
+            OrganizationActivity,
+            creator_type=ActivityType.ADMIN,
+            object_id=self.organization.id,
+        )
+        response = self._request(
+            "get", self._list_path(), {"creator_type": ActivityType.ORGANIZATION}
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {"next": None, "results": [self._get_serializer_data(activity)]},
+        )
+
+    @staticmethod
+    def _create_activity(activity_class, **attributes):
+        activity = activity_class(**attributes)
+        activity_class.insert_partitioned((activity,))
+        return activity
+
+    @staticmethod
+    def _get_serializer_data(activity):
+        return {
+            "created_at": activity.id.generation_time.replace(tzinfo=None).isoformat(),
+            "creator_id": activity.creator_id,
+            "creator_organization_id": activity.creator_organization_id,
+            "creator_type": activity.creator_type,
+            "data": activity.data,
+            "id": str(activity.id),
+            "object_id": activity.object_id,
+            "object_type": activity._get_collection_name().removesuffix("_activity"),
+        }
@@ -1,5 +1,6 @@
 from main.factories.organization_factory import OrganizationFactory
 from main.models.organization import Organization
+from main.permissions.organization_permission import OrganizationPermission
 from main.tests.view_sets.organization_test_case import OrganizationTestCase
 from main.view_sets.organization_organization_view_set import (
     OrganizationOrganizationViewSet,
@@ -13,6 +14,16 @@ class OrganizationOrganizationViewSetTestCase(OrganizationTestCase):
     def test_destroy(self):
         self._act_and_assert_destroy_test(self.organization)
 
+    def test_destroy__permission(self):
+        organization_id = str(self.organization.id)
+        self.assertIn(
+            organization_id, OrganizationPermission.get_organization_ids(self.user.id)
+        )
+        self._act_and_assert_destroy_test_response_status(self.organization.id)
+        self.assertNotIn(
+            organization_id, OrganizationPermission.get_organization_ids(self.user.id)
+        )
+
     def test_retrieve(self):
         self._act_and_assert_retrieve_test(self.organization.id)
 
@@ -4,6 +4,8 @@ from rest_framework.status import HTTP_204_NO_CONTENT
 
 from main.factories.staff_factory import StaffFactory
 from main.models.staff import Staff
+from main.permissions.organization_permission import OrganizationPermission
+from main.shortcuts import get_staff_organization_ids
 from main.tests.view_sets.organization_test_case import OrganizationTestCase
 from main.view_sets.organization_staff_view_set import OrganizationStaffViewSet
 
@@ -22,6 +24,21 @@ class OrganizationStaffViewSetTestCase(OrganizationTestCase):
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
         self.assertTrue(Staff.objects.filter(id=staff.id).get().does_organization_agree)
 
+    def test_agreeing__permission(self):
+        staff = StaffFactory.create(
+            does_organization_agree=False,
+            does_user_agree=True,
+            organization=self.organization,
+        )
+        organization_id = str(self.organization.id)
+        self.assertNotIn(
+            organization_id, OrganizationPermission.get_organization_ids(staff.user_id)
+        )
+        self._act_and_assert_action_response_status("agreeing", {}, staff.id)
+        self.assertIn(
+            organization_id, OrganizationPermission.get_organization_ids(staff.user_id)
+        )
+
     def test_create(self):
         data = self._get_deserializer_data()
         filter_ = {**data, "does_organization_agree": True, "does_user_agree": False}
@@ -34,11 +51,32 @@ class OrganizationStaffViewSetTestCase(OrganizationTestCase):
             data, {"user": ["Staff is already created."]}
         )
 
+    def test_create__permission(self):
+        data = self._get_deserializer_data()
+        OrganizationPermission.get_organization_ids(data["user"])
+        self._act_and_assert_create_test_response_status(data)
+        self.assertIsNone(get_staff_organization_ids(data["user"]))
+
     def test_destroy(self):
         self._act_and_assert_destroy_test(
             StaffFactory.create(organization=self.organization)
         )
 
+    def test_destroy__permission(self):
+        staff = StaffFactory.create(
+            does_organization_agree=True,
+            does_user_agree=True,
+            organization=self.organization,
+        )
+        organization_id = str(self.organization.id)
+        self.assertIn(
+            organization_id, OrganizationPermission.get_organization_ids(staff.user_id)
+        )
+        self._act_and_assert_destroy_test_response_status(staff.id)
+        self.assertNotIn(
+            organization_id, OrganizationPermission.get_organization_ids(staff.user_id)
+        )
+
     def test_list__filter__does_organization_agree(self):
         StaffFactory.create_batch(
             3,
@@ -6,11 +6,11 @@ from main.factories.product_factory import ProductFactory
 from main.factories.product_shipping_with_related_factory import (
     ProductShippingWithRelatedFactory,
 )
-from main.models import ZONE_CHOICES
 from main.models.product import Product
 from main.models.product_shipping import ProductShipping
 from main.tests.view_sets.organization_test_case import OrganizationTestCase
 from main.view_sets.product_shipping_view_set import ProductShippingViewSet
+from main.zones import get_zone_codes
 
 
 class ProductShippingViewSetTestCase(OrganizationTestCase):
@@ -139,7 +139,7 @@ class ProductShippingViewSetTestCase(OrganizationTestCase):
         })
 
     def test_list__filter__zones__overlap(self):
-        zones = sample([choice[0] for choice in ZONE_CHOICES], 6)
+        zones = sample(sorted(get_zone_codes()), 6)
         ProductShippingWithRelatedFactory(
             product_shipping_kwargs={
                 "organization_id": self.organization.id,
@@ -203,7 +203,7 @@ class ProductShippingViewSetTestCase(OrganizationTestCase):
 
     def test_update(self):
         products = ProductFactory.create_batch(3, organization=self.organization)
-        zones = sample([choice[0] for choice in ZONE_CHOICES], 3)
+        zones = sample(sorted(get_zone_codes()), 3)
         product_shipping = ProductShippingWithRelatedFactory(
             products=products[0:2],
             product_shipping_kwargs={
@@ -1,7 +1,20 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import override_settings
 from factory import Iterator
+from rest_framework.reverse import reverse
+from rest_framework.status import HTTP_200_OK
 
+from main.activity_sinks import get_activity_sink
+from main.documents.activity_snapshot import ActivitySnapshot
+from main.factories.order_shipping_factory import OrderShippingFactory
 from main.factories.product_factory import ProductFactory
+from main.factories.product_shipping_factory import ProductShippingFactory
 from main.models.product import Product
+from main.serializers.product_serializer import ProductSerializer
+from main.shortcuts import delete_activity_state, get_activity_state
 from main.tests.view_sets.organization_test_case import OrganizationTestCase
 from main.view_sets.product_view_set import ProductViewSet
 
@@ -10,6 +23,106 @@ class ProductViewSetTestCase(OrganizationTestCase):
     basename = "product"
     view_set = ProductViewSet
 
+    def test_activities(self):
+        product = ProductFactory.create(organization=self.organization)
+        data = self._get_deserializer_data()
+        self._act_and_assert_update_test_response_status(data, product.id)
+        path = reverse(
+            "product-activities",
+            kwargs={"organization_id": self.organization.id, "pk": product.id},
+        )
+        response = self._request("get", path)
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertIsNone(response.json()["next"])
+        self.assertEqual(
+            [activity["data"] for activity in response.json()["results"]], [data]
+        )
+
+    @override_settings(ACTIVITY_SNAPSHOT_INTERVAL=2)
+    def test_activity_state(self):
+        product = ProductFactory.create(organization=self.organization)
+        data = self._get_deserializer_data()
+        for name in ("name-0", "name-1", "name-2"):
+            self._act_and_assert_update_test_response_status(
+                {**data, "name": name}, product.id
+            )
+        activity_class = self.view_set.activity_class
+        self.assertEqual(
+            ActivitySnapshot.objects(
+                collection=activity_class._get_collection_name(), object_id=product.id
+            ).count(),
+            1,
+        )
+        activities = list(
+            activity_class.partitioned_objects(object_id=product.id).order_by("id")
+        )
+        self.assertEqual(
+            activity_class.get_state(product.id, before=activities[1].id),
+            {**data, "name": "name-0"},
+        )
+        self.assertEqual(
+            activity_class.get_state(product.id, before=activities[2].id),
+            {**data, "name": "name-1"},
+        )
+        path = reverse(
+            "product-activity-state",
+            kwargs={"organization_id": self.organization.id, "pk": product.id},
+        )
+        response = self._request(
+            "get",
+            path,
+            {"at": (datetime.utcnow() + timedelta(seconds=1)).isoformat()},
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.json()["data"], {**data, "name": "name-2"})
+
+    @override_settings(
+        ACTIVITY_SINK={
+            "BACKEND": (
+                "main.activity_sinks.buffered_activity_sink.BufferedActivitySink"
+            ),
+            "OPTIONS": {"flush_interval": 60},
+        }
+    )
+    def test_activity_state__buffered(self):
+        get_activity_sink.cache_clear()
+        self.addCleanup(get_activity_sink.cache_clear)
+        product = ProductFactory.create(organization=self.organization)
+        data = self._get_deserializer_data()
+        activity_class = self.view_set.activity_class
+        self._act_and_assert_update_test_response_status(data, product.id)
+        delete_activity_state(activity_class, product.id)
+        self._act_and_assert_update_test_response_status(
+            {**data, "name": "name-0"}, product.id
+        )
+        get_activity_sink().stop()
+        self.assertEqual(
+            [
+                activity.data
+                for activity in activity_class.partitioned_objects(
+                    object_id=product.id
+                ).order_by("id")
+            ],
+            [data, {"name": "name-0"}],
+        )
+
+    @override_settings(ACTIVITY_SNAPSHOT_INTERVAL=2)
+    def test_activity_state__cache_miss(self):
+        product = ProductFactory.create(organization=self.organization)
+        data = self._get_deserializer_data()
+        activity_class = self.view_set.activity_class
+        for name in ("name-0", "name-1"):
+            delete_activity_state(activity_class, product.id)
+            self._act_and_assert_update_test_response_status(
+                {**data, "name": name}, product.id
+            )
+        self.assertEqual(
+            ActivitySnapshot.objects(
+                collection=activity_class._get_collection_name(), object_id=product.id
+            ).count(),
+            1,
+        )
+
     def test_create(self):
         data = self._get_deserializer_data()
         self._act_and_assert_create_test(data, {**data})
@@ -26,6 +139,16 @@ class ProductViewSetTestCase(OrganizationTestCase):
             ProductFactory.create(organization=self.organization)
         )
 
+    def test_destroy__activity_state(self):
+        product = ProductFactory.create(organization=self.organization)
+        self._act_and_assert_update_test_response_status(
+            self._get_deserializer_data(), product.id
+        )
+        activity_class = self.view_set.activity_class
+        self.assertIsNotNone(get_activity_state(activity_class, product.id))
+        self._act_and_assert_destroy_test_response_status(product.id)
+        self.assertIsNone(get_activity_state(activity_class, product.id))
+
     def test_list__filter__code__icontains(self):
         ProductFactory.create(organization=self.organization)
         ProductFactory.create_batch(
@@ -58,6 +181,22 @@ class ProductViewSetTestCase(OrganizationTestCase):
         ProductFactory.create_batch(4, organization=self.organization)
         self._act_and_assert_list_test({"limit": 2, "offset": 1, "ordering": "id"})
 
+    def test_list__search(self):
+        products = ProductFactory.create_batch(
+            3,
+            code=Iterator(("p-0", "p-1", "p-2")),
+            name=Iterator(("Green apple", "Apple", "Grape")),
+            organization=self.organization,
+        )
+        ids = []
+        path = f"{self._list_path()}?limit=1&search=apple"
+        while path is not None:
+            response = self._request("get", path)
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            ids += [data["id"] for data in response.json()["results"]]
+            path = response.json()["next"]
+        self.assertEqual(ids, [products[1].id, products[0].id])
+
     def test_list__sort__code(self):
         ProductFactory.create_batch(2, organization_id=self.organization.id)
         self._act_and_assert_list_test({"ordering": "code"})
@@ -75,12 +214,69 @@ class ProductViewSetTestCase(OrganizationTestCase):
             ProductFactory.create(organization=self.organization).id
         )
 
+    def test_retrieve__unhandled_exception(self):
+        product = ProductFactory.create(organization=self.organization)
+        with patch.object(
+            ProductSerializer, "to_representation", side_effect=RuntimeError
+        ), self.assertRaises(RuntimeError):
+            self.client.get(self._detail_path(product.id), format="json")
+        self.assertEqual(connection.execute_wrappers, [])
+        self.assertTrue(Product.objects.filter(id=product.id).exists())
+
+    def test_shippings(self):
+        product = ProductFactory.create(organization=self.organization)
+        product_shippings = [
+            ProductShippingFactory.create(organization=self.organization, zones=zones)
+            for zones in (["JP"], ["JP-13", "US"], ["US"])
+        ]
+        for product_shipping in product_shippings:
+            product_shipping.products.add(product)
+        ProductShippingFactory.create(organization=self.organization, zones=["JP"])
+        order_shippings = [
+            OrderShippingFactory.create(organization=self.organization, zones=zones)
+            for zones in (["ALL"], ["JP-01"])
+        ]
+        path = reverse(
+            "product-shippings",
+            kwargs={"organization_id": self.organization.id, "pk": product.id},
+        )
+        response = self._request("get", f"{path}?zone=JP-13")
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            [data["id"] for data in response.json()["order_shippings"]],
+            [order_shippings[0].id],
+        )
+        self.assertEqual(
+            [data["id"] for data in response.json()["product_shippings"]],
+            [product_shippings[0].id, product_shippings[1].id],
+        )
+
     def test_update(self):
         product = ProductFactory.create(organization_id=self.organization.id)
         data = self._get_deserializer_data()
         filter_ = {**data, "organization_id": self.organization.id}
         self._act_and_assert_update_test(data, filter_, product.id)
 
+    def test_update__unchanged(self):
+        product = ProductFactory.create(organization_id=self.organization.id)
+        data = self._get_deserializer_data()
+        self._act_and_assert_update_test_response_status(data, product.id)
+        self._act_and_assert_update_test_response_status(
+            {**data, "name": f"{data['name']}-"}, product.id
+        )
+        self._act_and_assert_update_test_response_status(
+            {**data, "name": f"{data['name']}-"}, product.id
+        )
+        self.assertCountEqual(
+            [
+                activity.data
+                for activity in self.view_set.activity_class.partitioned_objects(
+                    object_id=product.id
+                )
+            ],
+            [data, {"name": f"{data['name']}-"}],
+        )
+
     @staticmethod
     def _get_deserializer_data():
         product = ProductFactory.build()
@@ -108,8 +108,10 @@ class PublicUserViewSetTestCase(ViewSetTestCase):
         user = UserFactory.create()
         set_password_resetting_token(user.id)
         data = {"password": password, "token": get_password_resetting_token(user.id)}
-        filter_ = {"password": password}
-        self._act_and_assert_update_test(data, filter_, user.id)
+        filter_ = {"password": password, "id": user.id}
+        self._act_and_assert_update_test_response_status(data, user.id)
+        self._assert_and_get_saved_object(data, filter_)
+        self.assertEqual(self.view_set.activity_class.partitioned_objects().count(), 0)
         self.assertIsNone(get_password_resetting_token(user.id))
 
     def test_update__token_not_match(self):
@@ -0,0 +1,26 @@
+from rest_framework.reverse import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+
+from main.tests.view_sets.view_set_test_case import ViewSetTestCase
+from main.view_sets.public_zone_view_set import PublicZoneViewSet
+from main.zones import get_zone_list
+
+
+class PublicZoneViewSetTestCase(ViewSetTestCase):
+    basename = "public-zone"
+    view_set = PublicZoneViewSet
+
+    def test_list(self):
+        response = self._request("get", reverse("public-zone-list"))
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.json(), get_zone_list())
+        self.assertIn({"code": "JP-13", "name": "Tokyo"}, response.json())
+        self.assertIn("max-age=86400", response["Cache-Control"])
+
+    def test_list__not_modified(self):
+        path = reverse("public-zone-list")
+        etag = self._request("get", path)["ETag"]
+        response = self._request("get", path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
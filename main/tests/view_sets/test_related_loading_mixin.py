@@ -0,0 +1,37 @@
+from django.test import SimpleTestCase
+
+from main.models.order import Order
+from main.models.product_shipping import ProductShipping
+from main.models.staff import Staff
+from main.serializers.order_serializer import OrderSerializer
+from main.serializers.product_shipping_serializer import ProductShippingSerializer
+from main.serializers.staff_serializer import StaffSerializer
+from main.serializers.user_staff_serializer import UserStaffSerializer
+from main.view_sets.related_loading_mixin import get_related_lookups
+
+
+class RelatedLoadingMixinTestCase(SimpleTestCase):
+    def test_get_related_lookups__dotted_source(self):
+        self.assertEqual(get_related_lookups(StaffSerializer, Staff), (("user",), ()))
+        self.assertEqual(
+            get_related_lookups(UserStaffSerializer, Staff), (("organization",), ())
+        )
+
+    def test_get_related_lookups__many_related_field(self):
+        self.assertEqual(
+            get_related_lookups(ProductShippingSerializer, ProductShipping),
+            ((), ("products",)),
+        )
+
+    def test_get_related_lookups__nested_serializer(self):
+        self.assertEqual(
+            get_related_lookups(OrderSerializer, Order),
+            (
+                (),
+                (
+                    "ordershippingitem_set",
+                    "productitem_set",
+                    "productitem_set__productshippingitem_set",
+                ),
+            ),
+        )
@@ -4,6 +4,8 @@ from rest_framework.status import HTTP_204_NO_CONTENT
 
 from main.factories.staff_factory import StaffFactory
 from main.models.staff import Staff
+from main.permissions.organization_permission import OrganizationPermission
+from main.shortcuts import get_staff_organization_ids
 from main.tests.view_sets.user_test_case import UserTestCase
 from main.view_sets.user_staff_view_set import UserStaffViewSet
 
@@ -21,6 +23,19 @@ class UserStaffViewSetTestCase(UserTestCase):
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
         self.assertTrue(Staff.objects.filter(id=staff.id).get().does_user_agree)
 
+    def test_agreeing__permission(self):
+        staff = StaffFactory.create(
+            does_organization_agree=True, does_user_agree=False, user=self.user
+        )
+        organization_id = str(staff.organization_id)
+        self.assertNotIn(
+            organization_id, OrganizationPermission.get_organization_ids(self.user.id)
+        )
+        self._act_and_assert_action_response_status("agreeing", {}, staff.id)
+        self.assertIn(
+            organization_id, OrganizationPermission.get_organization_ids(self.user.id)
+        )
+
     def test_create(self):
         data = self._get_deserializer_data()
         filter_ = {**data, "does_organization_agree": False, "does_user_agree": True}
@@ -33,9 +48,27 @@ class UserStaffViewSetTestCase(UserTestCase):
             data, {"organization": ["Staff is already created."]}
         )
 
+    def test_create__permission(self):
+        OrganizationPermission.get_organization_ids(self.user.id)
+        self._act_and_assert_create_test_response_status(self._get_deserializer_data())
+        self.assertIsNone(get_staff_organization_ids(self.user.id))
+
     def test_destroy(self):
         self._act_and_assert_destroy_test(StaffFactory.create(user=self.user))
 
+    def test_destroy__permission(self):
+        staff = StaffFactory.create(
+            does_organization_agree=True, does_user_agree=True, user=self.user
+        )
+        organization_id = str(staff.organization_id)
+        self.assertIn(
+            organization_id, OrganizationPermission.get_organization_ids(self.user.id)
+        )
+        self._act_and_assert_destroy_test_response_status(staff.id)
+        self.assertNotIn(
+            organization_id, OrganizationPermission.get_organization_ids(self.user.id)
+        )
+
     def test_list__filter__does_organization_agree(self):
         StaffFactory.create_batch(
             3, user=self.user, does_organization_agree=Iterator([True, True, False])
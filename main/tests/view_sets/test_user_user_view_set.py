@@ -7,6 +7,7 @@ from main.factories.user_factory import UserFactory
 from main.models.user import User
 from main.shortcuts import (
     get_authentication_token,
+    get_authentication_token_and_user,
     get_email_verifying_token,
     set_email_verifying_token,
 )
@@ -29,6 +30,7 @@ class UserUserViewSetTestCase(UserTestCase):
 
     def test_destroy(self):
         self._act_and_assert_destroy_test(self.user)
+        self.assertEqual(get_authentication_token_and_user(self.user.id), (None, None))
 
     def test_retrieve(self):
         self._act_and_assert_retrieve_test(self.user.id)
@@ -44,6 +46,7 @@ class UserUserViewSetTestCase(UserTestCase):
         filter_ = {**data}
         del filter_["current_password"]
         self._act_and_assert_update_test(data, filter_, self.user.id)
+        self.assertIsNone(get_authentication_token_and_user(self.user.id)[1])
         del filter_["password"]
         user = User.objects.filter(**filter_).first()
         body = (
@@ -1,6 +1,9 @@
+from urllib.parse import urlsplit
+
 from django.core import mail
 from django.core.cache import cache
 from django.db.models import QuerySet
+from django.urls import resolve
 from mongoengine import get_connection
 from rest_framework.reverse import reverse
 from rest_framework.status import (
@@ -11,7 +14,9 @@ from rest_framework.status import (
 )
 from rest_framework.test import APITestCase
 
+from main.documents.activity import _indexed_partition_names
 from main.shortcuts import OBSCURE_ACTIVITY_DATA_KEYS
+from main.tests.call_recorder import assert_call_budget, record_calls
 
 
 class ViewSetTestCase(APITestCase):
@@ -23,25 +28,44 @@ class ViewSetTestCase(APITestCase):
         get_connection().drop_database("test")
 
     def _act_and_assert_action_response_status(self, action, data, pk):
-        response = self.client.post(self._action_path(action, pk), data, format="json")
+        response = self._request("post", self._action_path(action, pk), data)
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
 
     def _act_and_assert_action_validation_test(self, action, data, expected, pk):
-        response = self.client.post(self._action_path(action, pk), data, format="json")
+        response = self._request("post", self._action_path(action, pk), data)
         self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
         self.assertEqual(response.json(), expected)
 
+    def _act_and_assert_call_scaling(self, prepare, sizes=(1, 10, 100)):
+        counts_list = []
+        for size in (sizes[0], *sizes):
+            method, path, data = prepare(size)
+            _indexed_partition_names.clear()
+            with record_calls() as counts:
+                response = getattr(self.client, method)(path, data, format="json")
+            self.assertLess(response.status_code, HTTP_400_BAD_REQUEST)
+            counts_list.append({**counts})
+        self.assertEqual(
+            dict(zip(sizes, counts_list[1:])),
+            {size: counts_list[1] for size in sizes},
+            "Calls grow with the payload size.",
+        )
+        for size, counts in zip(sizes, counts_list[1:]):
+            assert_call_budget(
+                self, f"{self._call_budget_name(method, path)} size={size}", counts
+            )
+
     def _act_and_assert_create_test(self, data, filter_):
         self._act_and_assert_create_test_response_status(data)
         object_ = self._assert_and_get_saved_object(data, filter_)
         self._assert_saved_activity(data, object_)
 
     def _act_and_assert_create_test_response_status(self, data):
-        response = self.client.post(self._list_path(), data, format="json")
+        response = self._request("post", self._list_path(), data)
         self.assertEqual(response.status_code, HTTP_201_CREATED)
 
     def _act_and_assert_create_validation_test(self, data, expected):
-        response = self.client.post(self._list_path(), data, format="json")
+        response = self._request("post", self._list_path(), data)
         self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
         self.assertEqual(response.json(), expected)
 
@@ -50,11 +74,11 @@ class ViewSetTestCase(APITestCase):
         self._assert_destroyed_object(object_)
 
     def _act_and_assert_destroy_test_response_status(self, pk):
-        response = self.client.delete(self._detail_path(pk), format="json")
+        response = self._request("delete", self._detail_path(pk))
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
 
     def _act_and_assert_list_test(self, request_query):
-        response = self.client.get(self._list_path(), request_query, format="json")
+        response = self._request("get", self._list_path(), request_query)
         self.assertEqual(response.status_code, HTTP_200_OK)
         if "ordering" in request_query:
             self.assertEqual(
@@ -66,7 +90,7 @@ class ViewSetTestCase(APITestCase):
             )
 
     def _act_and_assert_retrieve_test(self, pk):
-        response = self.client.get(self._detail_path(pk), format="json")
+        response = self._request("get", self._detail_path(pk))
         self.assertEqual(response.status_code, HTTP_200_OK)
         self.assertEqual(response.json(), self._expected_data_list({"id": pk})[0])
 
@@ -77,11 +101,11 @@ class ViewSetTestCase(APITestCase):
         self._assert_saved_activity(data, object_)
 
     def _act_and_assert_update_test_response_status(self, data, pk):
-        response = self.client.put(self._detail_path(pk), data, format="json")
+        response = self._request("put", self._detail_path(pk), data)
         self.assertEqual(response.status_code, HTTP_200_OK)
 
     def _act_and_assert_update_validation_test(self, data, expected, pk):
-        response = self.client.put(self._detail_path(pk), data, format="json")
+        response = self._request("put", self._detail_path(pk), data)
         self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
         self.assertEqual(response.json(), expected)
 
@@ -112,7 +136,7 @@ class ViewSetTestCase(APITestCase):
             for key, value in request_data.items()
             if key not in OBSCURE_ACTIVITY_DATA_KEYS
         }
-        query_set = self.view_set.activity_class.objects.filter(
+        query_set = self.view_set.activity_class.partitioned_objects(
             creator_id=getattr(self, "user", None) and self.user.id,
             creator_organization_id=getattr(self, "organization", None)
             and self.organization.id,
@@ -124,6 +148,10 @@ class ViewSetTestCase(APITestCase):
         )
         self.assertEqual(query_set.count(), 1)
 
+    @staticmethod
+    def _call_budget_name(method, path):
+        return f"{method.upper()} {resolve(urlsplit(path).path).url_name}"
+
     def _detail_path(self, pk):
         return self._path("detail", {"pk": pk})
 
@@ -151,3 +179,12 @@ class ViewSetTestCase(APITestCase):
 
     def _path(self, action, kwargs):
         return reverse(f"{self.basename}-{action}", kwargs=kwargs)
+
+    def _request(self, method, path, data=None, **extra):
+        _indexed_partition_names.clear()
+        with record_calls() as counts:
+            response = getattr(self.client, method)(
+                path, data, **{"format": "json", **extra}
+            )
+        assert_call_budget(self, self._call_budget_name(method, path), counts)
+        return response
@@ -3,9 +3,25 @@ from django.core.mail import send_mail
 from django.utils.http import urlencode
 from rest_framework.reverse import reverse
 
+from main.filter_sets.activity_filter_set import ActivityFilterSet
+from main.paginations.activity_pagination import ActivityPagination
+from main.serializers.activity_serializer import ActivitySerializer
 from main.shortcuts import get_email_verifying_token
 
 
+def get_activity_response(request, querysets):
+    filter_set = ActivityFilterSet(data=request.query_params, partial=True)
+    filter_set.is_valid(raise_exception=True)
+    paginator = ActivityPagination()
+    activities = paginator.paginate_querysets(
+        [queryset.filter(**filter_set.validated_data) for queryset in querysets],
+        request,
+    )
+    return paginator.get_paginated_response(
+        ActivitySerializer(activities, many=True).data
+    )
+
+
 @shared_task
 def send_email(message, recipient_list, subject):
     send_mail(
@@ -0,0 +1,56 @@
+from bson import ObjectId
+from django.http import Http404
+from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from main.filter_sets.activity_filter_set import ActivityFilterSet
+from main.filter_sets.activity_state_filter_set import ActivityStateFilterSet
+from main.serializers.activity_serializer import ActivitySerializer
+from main.serializers.activity_state_serializer import ActivityStateSerializer
+from main.view_sets import get_activity_response
+
+
+class ActivityMixin:
+    @extend_schema(
+        parameters=[ActivityFilterSet],
+        request=None,
+        responses=ActivitySerializer(many=True),
+    )
+    @action(detail=True, filter_backends=(), methods=("get",), pagination_class=None)
+    def activities(self, request, *_args, **_kwargs):
+        instance = get_object_or_404(self.get_queryset(), pk=self.kwargs["pk"])
+        return get_activity_response(
+            request, (self.activity_class.partitioned_objects(object_id=instance.id),)
+        )
+
+    @extend_schema(
+        parameters=[ActivityStateFilterSet],
+        request=None,
+        responses=ActivityStateSerializer,
+    )
+    @action(
+        detail=True,
+        filter_backends=(),
+        methods=("get",),
+        pagination_class=None,
+        url_path="activity-state",
+    )
+    def activity_state(self, request, *_args, **_kwargs):
+        instance = get_object_or_404(self.get_queryset(), pk=self.kwargs["pk"])
+        filter_set = ActivityStateFilterSet(data=request.query_params)
+        filter_set.is_valid(raise_exception=True)
+        at = filter_set.validated_data["at"]
+        data = self.activity_class.get_state(
+            instance.id, before=ObjectId.from_datetime(at)
+        )
+        if data is None:
+            raise Http404
+        return Response(
+            ActivityStateSerializer({
+                "at": at,
+                "data": data,
+                "object_id": instance.id,
+            }).data
+        )
@@ -0,0 +1,16 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from main.metrics import counters, gauges
+from main.permissions.admin_permission import AdminPermission
+
+
+@extend_schema(tags=["admin_metrics"])
+class AdminMetricViewSet(ViewSet):
+    permission_classes = (AdminPermission,)
+
+    @extend_schema(responses={200: OpenApiTypes.OBJECT})
+    def list(self, _request, *_args, **_kwargs):
+        return Response({**counters, **gauges})
@@ -5,7 +5,7 @@ from main.documents.organization_activity import OrganizationActivity
 from main.models.organization import Organization
 from main.permissions.admin_permission import AdminPermission
 from main.serializers.admin_organization_serializer import AdminOrganizationSerializer
-from main.shortcuts import ActivityType
+from main.shortcuts import ActivityType, delete_staff_organization_ids
 from main.view_sets.create_mixin import CreateMixin
 
 
@@ -16,3 +16,7 @@ class AdminOrganizationViewSet(CreateMixin, GenericViewSet):
     permission_classes = (AdminPermission,)
     queryset = Organization.objects.all()
     serializer_class = AdminOrganizationSerializer
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        delete_staff_organization_ids(serializer.validated_data["user"].id)
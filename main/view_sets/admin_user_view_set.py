@@ -6,12 +6,14 @@ from main.filter_sets.user_filter_set import UserFilterSet
 from main.models.user import User
 from main.permissions.admin_permission import AdminPermission
 from main.serializers.user_serializer import UserSerializer
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 
 
 @extend_schema(tags=["admin_users"])
-class AdminUserViewSet(ListModelMixin, GenericViewSet):
+class AdminUserViewSet(ListModelMixin, RelatedLoadingMixin, GenericViewSet):
     filter_set_class = UserFilterSet
     ordering_fields = ("email", "id", "name")
     permission_classes = (AdminPermission,)
     queryset = User.objects.all()
+    search_fields = ("email", "name")
     serializer_class = UserSerializer
@@ -0,0 +1,15 @@
+from main.shortcuts import set_pricing_version
+
+
+class CachedPricingMixin:
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        set_pricing_version(self.kwargs["organization_id"])
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        set_pricing_version(self.kwargs["organization_id"])
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        set_pricing_version(self.kwargs["organization_id"])
@@ -0,0 +1,10 @@
+from rest_framework.mixins import DestroyModelMixin
+
+from main.shortcuts import delete_activity_state
+
+
+class DestroyMixin(DestroyModelMixin):
+    def perform_destroy(self, instance):
+        object_id = instance.id
+        super().perform_destroy(instance)
+        delete_activity_state(self.activity_class, object_id)
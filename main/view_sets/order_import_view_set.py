@@ -0,0 +1,54 @@
+from django.http import Http404
+from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.status import HTTP_201_CREATED
+from rest_framework.viewsets import ViewSet
+
+from main.order_imports import OrderImportStatus, create_order_import, import_orders
+from main.permissions.organization_permission import OrganizationPermission
+from main.serializers.order_import_serializer import OrderImportSerializer
+from main.shortcuts import get_order_import
+
+
+@extend_schema(tags=["organizations_order_imports"])
+class OrderImportViewSet(ViewSet):
+    parser_classes = (MultiPartParser,)
+    permission_classes = (OrganizationPermission,)
+
+    @extend_schema(request=OrderImportSerializer, responses=OrderImportSerializer)
+    def create(self, request, *_args, **_kwargs):
+        serializer = OrderImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        order_import = create_order_import(
+            serializer.validated_data["file"],
+            serializer.validated_data["format"],
+            self.kwargs["organization_id"],
+            request.user.id,
+        )
+        return Response(
+            OrderImportSerializer(order_import).data, status=HTTP_201_CREATED
+        )
+
+    @extend_schema(request=None, responses=OrderImportSerializer)
+    @action(detail=True, methods=("post",))
+    def resuming(self, _request, *_args, **_kwargs):
+        order_import = self._get_order_import()
+        if order_import["status"] != OrderImportStatus.FAILED:
+            raise ValidationError(detail="Only failed imports can be resumed.")
+        import_orders.delay(order_import["id"])
+        return Response(OrderImportSerializer(order_import).data)
+
+    @extend_schema(responses=OrderImportSerializer)
+    def retrieve(self, _request, *_args, **_kwargs):
+        return Response(OrderImportSerializer(self._get_order_import()).data)
+
+    def _get_order_import(self):
+        order_import = get_order_import(self.kwargs["pk"])
+        if order_import is None or order_import["organization_id"] != int(
+            self.kwargs["organization_id"]
+        ):
+            raise Http404
+        return order_import
@@ -1,5 +1,5 @@
 from drf_spectacular.utils import extend_schema
-from rest_framework.mixins import DestroyModelMixin, ListModelMixin, RetrieveModelMixin
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.viewsets import GenericViewSet
 
 from main.documents.order_shipping_activity import OrderShippingActivity
@@ -8,15 +8,22 @@ from main.models.order_shipping import OrderShipping
 from main.permissions.organization_permission import OrganizationPermission
 from main.serializers.order_shipping_serializer import OrderShippingSerializer
 from main.shortcuts import ActivityType
+from main.view_sets.activity_mixin import ActivityMixin
+from main.view_sets.cached_pricing_mixin import CachedPricingMixin
 from main.view_sets.create_mixin import CreateMixin
+from main.view_sets.destroy_mixin import DestroyMixin
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 from main.view_sets.update_mixin import UpdateMixin
 
 
 @extend_schema(tags=["organizations_order_shippings"])
 class OrderShippingViewSet(
+    ActivityMixin,
+    CachedPricingMixin,
     CreateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     ListModelMixin,
+    RelatedLoadingMixin,
     RetrieveModelMixin,
     UpdateMixin,
     GenericViewSet,
@@ -27,4 +34,5 @@ class OrderShippingViewSet(
     ordering_fields = ("code", "fixed_fee", "id", "name", "unit_fee")
     permission_classes = (OrganizationPermission,)
     queryset = OrderShipping.objects.all()
+    search_fields = ("code", "name")
     serializer_class = OrderShippingSerializer
@@ -1,22 +1,39 @@
+from django.conf import settings
+from django.db.models import prefetch_related_objects
 from drf_spectacular.utils import extend_schema
-from rest_framework.mixins import DestroyModelMixin, ListModelMixin, RetrieveModelMixin
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.response import Response
+from rest_framework.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 from rest_framework.viewsets import GenericViewSet
 
 from main.documents.order_activity import OrderActivity
 from main.filter_sets.order_filter_set import OrderFilterSet
 from main.models.order import Order
+from main.order_quotes import quote_order
+from main.paginations.keyset_pagination import KeysetPagination
 from main.permissions.organization_permission import OrganizationPermission
+from main.serializers.order_batch_result_serializer import OrderBatchResultSerializer
+from main.serializers.order_fast_serializer import OrderFastSerializer
+from main.serializers.order_quote_serializer import OrderQuoteSerializer
 from main.serializers.order_serializer import OrderSerializer
 from main.shortcuts import ActivityType
+from main.view_sets.activity_mixin import ActivityMixin
 from main.view_sets.create_mixin import CreateMixin
+from main.view_sets.destroy_mixin import DestroyMixin
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 from main.view_sets.update_mixin import UpdateMixin
 
 
 @extend_schema(tags=["organizations_orders"])
 class OrderViewSet(
+    ActivityMixin,
     CreateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     ListModelMixin,
+    RelatedLoadingMixin,
     RetrieveModelMixin,
     UpdateMixin,
     GenericViewSet,
@@ -33,13 +50,107 @@ class OrderViewSet(
         "product_total",
         "total",
     )
+    pagination_class = KeysetPagination
     permission_classes = (OrganizationPermission,)
-    queryset = Order.objects.prefetch_related(
-        "productitem_set__productshippingitem_set"
-    ).all()
+    queryset = Order.objects.all()
+    search_fields = ("code",)
     serializer_class = OrderSerializer
 
     def get_queryset(self):
         return (
             super().get_queryset().filter(organization=self.kwargs["organization_id"])
         )
+
+    def list(self, request, *args, **kwargs):
+        field_names = self.get_field_names()
+        page = self.paginate_queryset(self._get_fast_queryset(field_names))
+        return self.get_paginated_response(
+            OrderFastSerializer(page, field_names=field_names, many=True).data
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        field_names = self.get_field_names()
+        values = get_object_or_404(
+            self._get_fast_queryset(field_names), pk=self.kwargs["pk"]
+        )
+        return Response(OrderFastSerializer(values, field_names=field_names).data)
+
+    @extend_schema(
+        request=OrderSerializer(many=True),
+        responses=OrderBatchResultSerializer(many=True),
+    )
+    @action(detail=False, filter_backends=(), methods=("post",), pagination_class=None)
+    def batch(self, request, *_args, **_kwargs):
+        data_list = request.data
+        if not isinstance(data_list, list):
+            raise ValidationError(detail="Expected a list of orders.")
+        max_size = settings.ORDER_BATCH_MAX_SIZE
+        if len(data_list) > max_size:
+            raise ValidationError(
+                detail=f"Ensure this list has no more than {max_size} orders."
+            )
+        organization_id = self.kwargs["organization_id"]
+        results = []
+        valid_indexes = []
+        validated_data_list = []
+        for index, (validated_data, errors) in enumerate(
+            OrderSerializer.validate_many(
+                data_list, organization_id, self.get_serializer_context()
+            )
+        ):
+            if errors is not None:
+                results.append({"errors": errors, "status": HTTP_400_BAD_REQUEST})
+                continue
+            valid_indexes.append(index)
+            validated_data_list.append(validated_data)
+            results.append(None)
+        created_indexes = []
+        orders = []
+        for index, (order, errors) in zip(
+            valid_indexes,
+            OrderSerializer.create_many(validated_data_list, organization_id),
+        ):
+            if errors is not None:
+                results[index] = {"errors": errors, "status": HTTP_400_BAD_REQUEST}
+                continue
+            created_indexes.append(index)
+            orders.append(order)
+        self.write_create_activities(
+            zip(orders, (data_list[index] for index in created_indexes))
+        )
+        prefetch_related_objects(
+            orders, "ordershippingitem_set", "productitem_set__productshippingitem_set"
+        )
+        for index, order in zip(created_indexes, orders):
+            results[index] = {"data": order, "status": HTTP_201_CREATED}
+        return Response(
+            OrderBatchResultSerializer(
+                results, context=self.get_serializer_context(), many=True
+            ).data
+        )
+
+    @extend_schema(request=OrderQuoteSerializer, responses=OrderSerializer)
+    @action(
+        detail=False,
+        filter_backends=(),
+        methods=("post",),
+        pagination_class=None,
+        url_path="quote",
+    )
+    def quoting(self, request, *_args, **_kwargs):
+        serializer = OrderQuoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(
+            quote_order(
+                self.kwargs["organization_id"],
+                serializer.validated_data["items"],
+                serializer.validated_data["zone"],
+            )
+        )
+
+    def _get_fast_queryset(self, field_names):
+        return (
+            self.filter_queryset(self.get_queryset())
+            .prefetch_related(None)
+            .values_list(*OrderFastSerializer.get_columns(field_names))
+        )
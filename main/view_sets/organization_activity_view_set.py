@@ -0,0 +1,42 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework.viewsets import GenericViewSet
+
+from main.documents.order_activity import OrderActivity
+from main.documents.order_shipping_activity import OrderShippingActivity
+from main.documents.organization_activity import OrganizationActivity
+from main.documents.product_activity import ProductActivity
+from main.documents.product_shipping_activity import ProductShippingActivity
+from main.documents.staff_activity import StaffActivity
+from main.filter_sets.activity_filter_set import ActivityFilterSet
+from main.permissions.organization_permission import OrganizationPermission
+from main.serializers.activity_serializer import ActivitySerializer
+from main.view_sets import get_activity_response
+
+
+@extend_schema(tags=["organizations_activities"])
+class OrganizationActivityViewSet(GenericViewSet):
+    activity_classes = (
+        OrderActivity,
+        OrderShippingActivity,
+        ProductActivity,
+        ProductShippingActivity,
+        StaffActivity,
+    )
+    filter_backends = ()
+    pagination_class = None
+    permission_classes = (OrganizationPermission,)
+    serializer_class = ActivitySerializer
+
+    @extend_schema(parameters=[ActivityFilterSet])
+    def list(self, request, *_args, **_kwargs):
+        organization_id = self.kwargs["organization_id"]
+        return get_activity_response(
+            request,
+            (
+                OrganizationActivity.partitioned_objects(object_id=organization_id),
+                *(
+                    activity_class.partitioned_objects(organization_id=organization_id)
+                    for activity_class in self.activity_classes
+                ),
+            ),
+        )
@@ -1,19 +1,20 @@
 from drf_spectacular.utils import extend_schema
-from rest_framework.mixins import DestroyModelMixin, RetrieveModelMixin
+from rest_framework.mixins import RetrieveModelMixin
 from rest_framework.viewsets import GenericViewSet
 
 from main.documents.organization_activity import OrganizationActivity
 from main.models.organization import Organization
 from main.permissions.organization_permission import OrganizationPermission
 from main.serializers.organization_serializer import OrganizationSerializer
-from main.shortcuts import ActivityType
+from main.shortcuts import ActivityType, delete_staff_organization_ids_many
+from main.view_sets.destroy_mixin import DestroyMixin
 from main.view_sets.update_mixin import UpdateMixin
 
 
 @extend_schema(tags=["organizations_organizations"])
 class OrganizationOrganizationViewSet(
     UpdateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     RetrieveModelMixin,
     GenericViewSet,
 ):
@@ -25,3 +26,8 @@ class OrganizationOrganizationViewSet(
 
     def get_queryset(self):
         return super().get_queryset().filter(id=self.kwargs["organization_id"])
+
+    def perform_destroy(self, instance):
+        user_ids = list(instance.staff_set.values_list("user_id", flat=True))
+        super().perform_destroy(instance)
+        delete_staff_organization_ids_many(user_ids)
@@ -1,6 +1,6 @@
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
-from rest_framework.mixins import DestroyModelMixin, ListModelMixin, RetrieveModelMixin
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.response import Response
 from rest_framework.status import HTTP_204_NO_CONTENT
 from rest_framework.viewsets import GenericViewSet
@@ -10,15 +10,20 @@ from main.filter_sets.staff_filter_set import StaffFilterSet
 from main.models.staff import Staff
 from main.permissions.organization_permission import OrganizationPermission
 from main.serializers.staff_serializer import StaffSerializer
-from main.shortcuts import ActivityType
+from main.shortcuts import ActivityType, delete_staff_organization_ids
+from main.view_sets.activity_mixin import ActivityMixin
 from main.view_sets.create_mixin import CreateMixin
+from main.view_sets.destroy_mixin import DestroyMixin
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 
 
 @extend_schema(tags=["organizations_staffs"])
 class OrganizationStaffViewSet(
+    ActivityMixin,
     CreateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     ListModelMixin,
+    RelatedLoadingMixin,
     RetrieveModelMixin,
     GenericViewSet,
 ):
@@ -46,4 +51,13 @@ class OrganizationStaffViewSet(
         staff = self.get_object()
         staff.does_organization_agree = True
         staff.save()
+        delete_staff_organization_ids(staff.user_id)
         return Response(status=HTTP_204_NO_CONTENT)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        delete_staff_organization_ids(serializer.instance.user_id)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        delete_staff_organization_ids(instance.user_id)
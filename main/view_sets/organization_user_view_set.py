@@ -6,12 +6,14 @@ from main.filter_sets.user_filter_set import UserFilterSet
 from main.models.user import User
 from main.permissions.organization_permission import OrganizationPermission
 from main.serializers.user_serializer import UserSerializer
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 
 
 @extend_schema(tags=["organizations_users"])
-class OrganizationUserViewSet(ListModelMixin, GenericViewSet):
+class OrganizationUserViewSet(ListModelMixin, RelatedLoadingMixin, GenericViewSet):
     filter_set_class = UserFilterSet
     ordering_fields = ("email", "id", "name")
     permission_classes = (OrganizationPermission,)
     queryset = User.objects.all()
+    search_fields = ("email", "name")
     serializer_class = UserSerializer
@@ -1,5 +1,5 @@
 from drf_spectacular.utils import extend_schema
-from rest_framework.mixins import DestroyModelMixin, ListModelMixin, RetrieveModelMixin
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.viewsets import GenericViewSet
 
 from main.documents.product_shipping_activity import ProductShippingActivity
@@ -8,15 +8,22 @@ from main.models.product_shipping import ProductShipping
 from main.permissions.organization_permission import OrganizationPermission
 from main.serializers.product_shipping_serializer import ProductShippingSerializer
 from main.shortcuts import ActivityType
+from main.view_sets.activity_mixin import ActivityMixin
+from main.view_sets.cached_pricing_mixin import CachedPricingMixin
 from main.view_sets.create_mixin import CreateMixin
+from main.view_sets.destroy_mixin import DestroyMixin
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 from main.view_sets.update_mixin import UpdateMixin
 
 
 @extend_schema(tags=["organizations_product_shippings"])
 class ProductShippingViewSet(
+    ActivityMixin,
+    CachedPricingMixin,
     CreateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     ListModelMixin,
+    RelatedLoadingMixin,
     RetrieveModelMixin,
     UpdateMixin,
     GenericViewSet,
@@ -27,6 +34,7 @@ class ProductShippingViewSet(
     ordering_fields = ("code", "fixed_fee", "id", "name", "unit_fee")
     permission_classes = (OrganizationPermission,)
     queryset = ProductShipping.objects.all()
+    search_fields = ("code", "name")
     serializer_class = ProductShippingSerializer
 
     def get_queryset(self):
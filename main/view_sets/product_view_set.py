@@ -1,22 +1,37 @@
 from drf_spectacular.utils import extend_schema
-from rest_framework.mixins import DestroyModelMixin, ListModelMixin, RetrieveModelMixin
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from main.documents.product_activity import ProductActivity
 from main.filter_sets.product_filter_set import ProductFilterSet
+from main.filter_sets.zone_filter_set import ZoneFilterSet
+from main.models.order_shipping import OrderShipping
 from main.models.product import Product
+from main.paginations.keyset_pagination import KeysetPagination
 from main.permissions.organization_permission import OrganizationPermission
+from main.serializers.applicable_shipping_serializer import ApplicableShippingSerializer
 from main.serializers.product_serializer import ProductSerializer
 from main.shortcuts import ActivityType
+from main.view_sets.activity_mixin import ActivityMixin
+from main.view_sets.cached_pricing_mixin import CachedPricingMixin
 from main.view_sets.create_mixin import CreateMixin
+from main.view_sets.destroy_mixin import DestroyMixin
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 from main.view_sets.update_mixin import UpdateMixin
+from main.zones import filter_zone
 
 
 @extend_schema(tags=["organizations_products"])
 class ProductViewSet(
+    ActivityMixin,
+    CachedPricingMixin,
     CreateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     ListModelMixin,
+    RelatedLoadingMixin,
     RetrieveModelMixin,
     UpdateMixin,
     GenericViewSet,
@@ -25,11 +40,36 @@ class ProductViewSet(
     activity_type = ActivityType.ORGANIZATION
     filter_set_class = ProductFilterSet
     ordering_fields = ("code", "id", "name", "price")
+    pagination_class = KeysetPagination
     permission_classes = (OrganizationPermission,)
     queryset = Product.objects.all()
+    search_fields = ("code", "name")
     serializer_class = ProductSerializer
 
     def get_queryset(self):
         return (
             super().get_queryset().filter(organization=self.kwargs["organization_id"])
         )
+
+    @extend_schema(
+        parameters=[ZoneFilterSet],
+        request=None,
+        responses=ApplicableShippingSerializer,
+    )
+    @action(detail=True, filter_backends=(), methods=("get",), pagination_class=None)
+    def shippings(self, request, *_args, **_kwargs):
+        product = get_object_or_404(self.get_queryset(), pk=self.kwargs["pk"])
+        filter_set = ZoneFilterSet(data=request.query_params)
+        filter_set.is_valid(raise_exception=True)
+        zone = filter_set.validated_data["zone"]
+        return Response(
+            ApplicableShippingSerializer({
+                "order_shippings": filter_zone(
+                    OrderShipping.objects.filter(organization=product.organization_id),
+                    zone,
+                ).order_by("id"),
+                "product_shippings": filter_zone(
+                    product.productshipping_set.prefetch_related("products"), zone
+                ).order_by("id"),
+            }).data
+        )
@@ -1,4 +1,3 @@
-from django.contrib.auth.hashers import check_password
 from django.utils.http import urlencode
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
@@ -11,6 +10,7 @@ from rest_framework.viewsets import GenericViewSet
 
 from main.documents.user_activity import UserActivity
 from main.models.user import User
+from main.password_hashing import check_password
 from main.serializers.public_user_authenticating_serializer import (
     PublicUserAuthenticatingSerializer,
 )
@@ -24,6 +24,7 @@ from main.serializers.public_user_password_resetting_serializer import (
 from main.serializers.public_user_update_serializer import PublicUserUpdateSerializer
 from main.shortcuts import (
     ActivityType,
+    delete_authentication_user,
     delete_email_verifying_token,
     get_authentication_token,
     get_email_verifying_token,
@@ -109,3 +110,7 @@ class PublicUserViewSet(CreateMixin, UpdateMixin, GenericViewSet):
     def perform_create(self, serializer):
         super().perform_create(serializer)
         send_email_verification(self.request, serializer.instance)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        delete_authentication_user(serializer.instance.id)
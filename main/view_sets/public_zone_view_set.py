@@ -0,0 +1,20 @@
+from django.utils.cache import get_conditional_response, patch_cache_control
+from drf_spectacular.utils import extend_schema
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from main.serializers.zone_serializer import ZoneSerializer
+from main.zones import get_zone_etag, get_zone_list
+
+
+@extend_schema(tags=["public_zone"])
+class PublicZoneViewSet(ViewSet):
+    @extend_schema(responses=ZoneSerializer(many=True))
+    def list(self, request, *_args, **_kwargs):
+        etag = f'"{get_zone_etag()}"'
+        response = get_conditional_response(request, etag=etag) or Response(
+            get_zone_list()
+        )
+        response["ETag"] = etag
+        patch_cache_control(response, max_age=86400, public=True)
+        return response
@@ -0,0 +1,196 @@
+from functools import cache
+
+from django.conf import settings
+from django.db import connection
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+READ_ACTIONS = ("list", "retrieve")
+
+
+class RelatedLoadingMixin:
+    _is_serializing = False
+
+    def dispatch(self, request, *args, **kwargs):
+        if not settings.LAZY_LOAD_ASSERTION:
+            return super().dispatch(request, *args, **kwargs)
+        with connection.execute_wrapper(self._assert_no_lazy_load):
+            return super().dispatch(request, *args, **kwargs)
+
+    def get_field_names(self):
+        query_params = self.request.query_params
+        if self.action not in READ_ACTIONS or not (
+            "fields" in query_params or "expand" in query_params
+        ):
+            return None
+        fields = self.get_serializer_class()().fields
+        nested_names = {name for name, field in fields.items() if _is_nested(field)}
+        scalar_names = set(fields) - nested_names
+        errors = {}
+        field_names = _split_names(query_params.get("fields"), scalar_names)
+        invalid_names = field_names - scalar_names
+        if invalid_names:
+            errors["fields"] = f"Invalid fields: {', '.join(sorted(invalid_names))}."
+        expanded_names = _split_names(query_params.get("expand"), set())
+        invalid_names = expanded_names - nested_names
+        if invalid_names:
+            errors["expand"] = f"Invalid expand: {', '.join(sorted(invalid_names))}."
+        if errors:
+            raise ValidationError(detail=errors)
+        return frozenset(field_names | expanded_names)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in READ_ACTIONS:
+            return queryset
+        serializer_class = self.get_serializer_class()
+        field_names = self.get_field_names()
+        select_related, prefetch_related = get_related_lookups(
+            serializer_class, queryset.model, field_names
+        )
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        if field_names is not None:
+            only_fields = get_only_fields(serializer_class, queryset.model, field_names)
+            if only_fields is not None:
+                queryset = queryset.only(*only_fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        field_names = self.get_field_names()
+        if field_names is not None:
+            fields = getattr(serializer, "child", serializer).fields
+            for name in set(fields) - field_names:
+                fields.pop(name)
+        if self.request.method == "GET" and args:
+            self._is_serializing = True
+        return serializer
+
+    def _assert_no_lazy_load(self, execute, sql, params, many, context):
+        if self._is_serializing:
+            raise AssertionError(f"Lazy load during serialization: {sql}")
+        return execute(sql, params, many, context)
+
+
+@cache
+def get_only_fields(serializer_class, model, field_names):
+    fields = serializer_class().fields
+    only_fields = {model._meta.pk.name}
+    for name in field_names:
+        field = fields[name]
+        if field.source == "*":
+            return None
+        current_model = model
+        for attribute in field.source_attrs:
+            model_field = _get_model_field(current_model, attribute)
+            if model_field is None:
+                return None
+            if model_field.many_to_many or model_field.one_to_many:
+                break
+            current_model = model_field.related_model
+        else:
+            only_fields.add("__".join(field.source_attrs))
+    return tuple(sorted(only_fields))
+
+
+@cache
+def get_related_lookups(serializer_class, model, field_names=None):
+    select_related = set()
+    prefetch_related = set()
+    _add_related_lookups(
+        serializer_class(),
+        model,
+        "",
+        False,
+        select_related,
+        prefetch_related,
+        field_names,
+    )
+    return tuple(sorted(select_related)), tuple(sorted(prefetch_related))
+
+
+def _add_related_lookups(
+    serializer,
+    model,
+    prefix,
+    is_prefetched,
+    select_related,
+    prefetch_related,
+    field_names=None,
+):
+    for name, field in serializer.fields.items():
+        if field.write_only or field.source == "*":
+            continue
+        if field_names is not None and name not in field_names:
+            continue
+        current_model = model
+        field_is_prefetched = is_prefetched
+        path = prefix
+        related_field = None
+        for index, attribute in enumerate(field.source_attrs):
+            related_field = _get_related_field(current_model, attribute)
+            if related_field is None or (
+                index == len(field.source_attrs) - 1 and _is_pk_only(field)
+            ):
+                related_field = None
+                break
+            path = f"{path}{attribute}"
+            if related_field.many_to_many or related_field.one_to_many:
+                field_is_prefetched = True
+            if field_is_prefetched:
+                prefetch_related.add(path)
+            else:
+                select_related.add(path)
+            current_model = related_field.related_model
+            path = f"{path}__"
+        if related_field is None:
+            continue
+        child = field.child if isinstance(field, ListSerializer) else field
+        if isinstance(child, BaseSerializer):
+            _add_related_lookups(
+                child,
+                current_model,
+                path,
+                field_is_prefetched,
+                select_related,
+                prefetch_related,
+            )
+
+
+def _get_model_field(model, attribute):
+    for field in model._meta.get_fields():
+        name = (
+            field.get_accessor_name()
+            if field.is_relation and field.auto_created and not field.concrete
+            else field.name
+        )
+        if name == attribute:
+            return field
+    return None
+
+
+def _get_related_field(model, attribute):
+    field = _get_model_field(model, attribute)
+    if field is None or not field.is_relation:
+        return None
+    return field
+
+
+def _is_nested(field):
+    return isinstance(field, BaseSerializer)
+
+
+def _is_pk_only(field):
+    if isinstance(field, ManyRelatedField):
+        return False
+    return isinstance(field, RelatedField) and field.use_pk_only_optimization()
+
+
+def _split_names(value, default):
+    if value is None:
+        return default
+    return {name.strip() for name in value.split(",") if name.strip()}
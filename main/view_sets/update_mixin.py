@@ -1,34 +1,61 @@
+from bson import ObjectId
+from django.conf import settings
+from django.db.transaction import atomic
 from rest_framework.mixins import UpdateModelMixin
 
-from main.shortcuts import OBSCURE_ACTIVITY_DATA_KEYS
+from main.activity_sinks import get_activity_sink
+from main.shortcuts import (
+    OBSCURE_ACTIVITY_DATA_KEYS,
+    get_activity_state,
+    set_activity_state,
+)
 
 
 class UpdateMixin(UpdateModelMixin):
+    @atomic
     def perform_update(self, serializer):
-        super().perform_update(serializer)
         instance = serializer.instance
-        request = self.request
-        lastest_activity_data = getattr(
-            self.activity_class.objects.filter(object_id=instance.id)
-            .order_by("-id")
-            .first(),
-            "data",
-            {},
+        list(
+            type(instance)
+            .objects.select_for_update()
+            .filter(pk=instance.pk)
+            .values_list("pk")
         )
+        super().perform_update(serializer)
+        request = self.request
+        activity_class = self.activity_class
+        state = get_activity_state(activity_class, instance.id)
+        if state is None:
+            # Rebuild from Mongo only after this process's pending activities land.
+            get_activity_sink().flush(activity_class)
+            state = activity_class.get_diff_state(instance.id)
         data = {
             key: value
             for key, value in request.data.items()
             if key not in OBSCURE_ACTIVITY_DATA_KEYS
-            and (
-                key not in lastest_activity_data or value != lastest_activity_data[key]
-            )
+            and (key not in state["data"] or value != state["data"][key])
         }
-        self.activity_class.objects.create(
-            creator_id=getattr(request.user, "id", None),
-            creator_organization_id=self.kwargs.get("organization_id"),
-            creator_type=self.activity_type,
-            data=data,
-            object_id=instance.id,
-            organization_id=getattr(instance, "organization_id", None),
-            user_id=getattr(instance, "user_id", None),
+        if not data:
+            return
+        activity_id = ObjectId()
+        get_activity_sink().write(
+            activity_class,
+            {
+                "creator_id": getattr(request.user, "id", None),
+                "creator_organization_id": self.kwargs.get("organization_id"),
+                "creator_type": self.activity_type,
+                "data": data,
+                "id": activity_id,
+                "object_id": instance.id,
+                "organization_id": getattr(instance, "organization_id", None),
+                "user_id": getattr(instance, "user_id", None),
+            },
         )
+        state = {
+            "data": {**state["data"], **data},
+            "diff_count": state["diff_count"] + 1,
+        }
+        if state["diff_count"] >= settings.ACTIVITY_SNAPSHOT_INTERVAL:
+            activity_class.save_snapshot(activity_id, instance.id, state["data"])
+            state["diff_count"] = 0
+        set_activity_state(activity_class, instance.id, state)
@@ -6,12 +6,14 @@ from main.filter_sets.organization_filter_set import OrganizationFilterSet
 from main.models.organization import Organization
 from main.permissions.user_permission import UserPermission
 from main.serializers.organization_serializer import OrganizationSerializer
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 
 
 @extend_schema(tags=["users_organizations"])
-class UserOrganizationViewSet(ListModelMixin, GenericViewSet):
+class UserOrganizationViewSet(ListModelMixin, RelatedLoadingMixin, GenericViewSet):
     filter_set_class = OrganizationFilterSet
     ordering_fields = ("code", "id")
     permission_classes = (UserPermission,)
     queryset = Organization.objects.all()
+    search_fields = ("code", "name")
     serializer_class = OrganizationSerializer
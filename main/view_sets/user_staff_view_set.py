@@ -1,6 +1,6 @@
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
-from rest_framework.mixins import DestroyModelMixin, ListModelMixin, RetrieveModelMixin
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.response import Response
 from rest_framework.status import HTTP_204_NO_CONTENT
 from rest_framework.viewsets import GenericViewSet
@@ -10,15 +10,18 @@ from main.filter_sets.staff_filter_set import StaffFilterSet
 from main.models.staff import Staff
 from main.permissions.user_permission import UserPermission
 from main.serializers.user_staff_serializer import UserStaffSerializer
-from main.shortcuts import ActivityType
+from main.shortcuts import ActivityType, delete_staff_organization_ids
 from main.view_sets.create_mixin import CreateMixin
+from main.view_sets.destroy_mixin import DestroyMixin
+from main.view_sets.related_loading_mixin import RelatedLoadingMixin
 
 
 @extend_schema(tags=["users_staffs"])
 class UserStaffViewSet(
     CreateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     ListModelMixin,
+    RelatedLoadingMixin,
     RetrieveModelMixin,
     GenericViewSet,
 ):
@@ -44,4 +47,13 @@ class UserStaffViewSet(
         staff = self.get_object()
         staff.does_user_agree = True
         staff.save()
+        delete_staff_organization_ids(staff.user_id)
         return Response(status=HTTP_204_NO_CONTENT)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        delete_staff_organization_ids(serializer.instance.user_id)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        delete_staff_organization_ids(instance.user_id)
@@ -1,6 +1,6 @@
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
-from rest_framework.mixins import DestroyModelMixin, RetrieveModelMixin
+from rest_framework.mixins import RetrieveModelMixin
 from rest_framework.response import Response
 from rest_framework.status import HTTP_204_NO_CONTENT
 from rest_framework.viewsets import GenericViewSet
@@ -9,15 +9,20 @@ from main.documents.user_activity import UserActivity
 from main.models.user import User
 from main.permissions.user_permission import UserPermission
 from main.serializers.user_serializer import UserSerializer
-from main.shortcuts import ActivityType, delete_authentication_token
+from main.shortcuts import (
+    ActivityType,
+    delete_authentication_token,
+    delete_authentication_user,
+)
 from main.view_sets import send_email_verification
+from main.view_sets.destroy_mixin import DestroyMixin
 from main.view_sets.update_mixin import UpdateMixin
 
 
 @extend_schema(tags=["users_users"])
 class UserUserViewSet(
     UpdateMixin,
-    DestroyModelMixin,
+    DestroyMixin,
     RetrieveModelMixin,
     GenericViewSet,
 ):
@@ -37,9 +42,16 @@ class UserUserViewSet(
         delete_authentication_token(user.id)
         return Response(status=HTTP_204_NO_CONTENT)
 
+    def perform_destroy(self, instance):
+        user_id = instance.id
+        super().perform_destroy(instance)
+        delete_authentication_token(user_id)
+        delete_authentication_user(user_id)
+
     def perform_update(self, serializer):
         current_email = serializer.instance.email
         super().perform_update(serializer)
         user = serializer.instance
+        delete_authentication_user(user.id)
         if current_email != user.email:
             send_email_verification(self.request, user)
@@ -0,0 +1,71 @@
+from functools import cache
+from hashlib import sha256
+from json import dumps
+
+from django.core.exceptions import ValidationError
+from pycountry import countries, subdivisions
+
+from main.models import ALL_ZONE
+
+
+def filter_zone(queryset, zone):
+    return queryset.filter(zones__overlap=list(get_zone_ancestors(zone)))
+
+
+@cache
+def get_zone_ancestors(zone):
+    parent_codes = _get_parent_codes()
+    ancestors = [zone]
+    while ancestors[-1] in parent_codes:
+        ancestors.append(parent_codes[ancestors[-1]])
+    if zone != ALL_ZONE:
+        ancestors.append(ALL_ZONE)
+    return tuple(ancestors)
+
+
+@cache
+def get_zone_codes():
+    return frozenset(_get_zone_table()[0])
+
+
+@cache
+def get_zone_etag():
+    return sha256(dumps(get_zone_list()).encode()).hexdigest()
+
+
+@cache
+def get_zone_list():
+    return [{"code": code, "name": name} for code, name in zip(*_get_zone_table())]
+
+
+def validate_zone(value):
+    if value not in get_zone_codes():
+        raise ValidationError(f"{value} isn't a valid zone.")
+
+
+def validate_zones(value):
+    messages = [
+        f"{zone} isn't a valid zone." for zone in value if zone not in get_zone_codes()
+    ]
+    if messages:
+        raise ValidationError(messages)
+
+
+@cache
+def _get_parent_codes():
+    return {
+        subdivision.code: subdivision.parent_code or subdivision.country_code
+        for subdivision in subdivisions
+    }
+
+
+@cache
+def _get_zone_table():
+    zones = sorted(
+        (
+            (ALL_ZONE, "all"),
+            *((country.alpha_2, country.name) for country in countries),
+            *((subdivision.code, subdivision.name) for subdivision in subdivisions),
+        )
+    )
+    return tuple(code for code, _name in zones), tuple(name for _code, name in zones)